@@ -0,0 +1,20 @@
+"""Laser Game package."""
+
+from .game import LaserGame, Level, LevelLoader, SolutionValidator
+
+__all__ = ["LaserGame", "Level", "LevelLoader", "SolutionValidator", "LaserGameUI"]
+
+
+def __getattr__(name):
+    # PEP 562: import the UI (and its pygame dependency) only on first access
+    # so headless consumers never pay for the GUI stack.
+    if name == "LaserGameUI":
+        from .ui import LaserGameUI
+
+        globals()["LaserGameUI"] = LaserGameUI
+        return LaserGameUI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | {"LaserGameUI"})
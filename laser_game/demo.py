@@ -0,0 +1,54 @@
+"""Headless demo: load a level, apply its solution and print the outcome.
+
+Run with ``python -m laser_game.demo [level_name]``.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from .game import LaserGame, LevelLoader, SolutionValidator
+
+# Resolved once at import: realpath() walks every path component, and main()
+# may be invoked repeatedly from tests or a REPL.  Module-level constants also
+# give tests a clean monkeypatching point.
+_PACKAGE_ROOT = Path(__file__).resolve().parent
+_LEVELS_ROOT = _PACKAGE_ROOT / "levels"
+_SOLUTIONS_ROOT = _PACKAGE_ROOT / "solutions"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("level", nargs="?", default="intro", help="level name (without .json)")
+    parser.add_argument(
+        "--no-solution", action="store_true", help="run the level without applying its solution"
+    )
+    args = parser.parse_args(argv)
+
+    level_loader = LevelLoader(_LEVELS_ROOT)
+    validator = SolutionValidator(_SOLUTIONS_ROOT)
+
+    level = level_loader.load(args.level)
+    if not args.no_solution:
+        solution = validator.load_solution(args.level)
+        level = validator.apply_solution(level, solution)
+
+    game = LaserGame(level)
+    game.propagate()
+    summary = game.playthrough_summary()
+
+    print(f"Level: {summary['metadata']['name']}")
+    print(f"Simulated ticks: {summary['metadata']['ticks']}")
+    print(f"Beam segments: {summary['segment_count']}")
+    print(f"Complete: {summary['metadata']['complete']}")
+    # One write for the whole block: N prints means N stdout lock
+    # acquisitions and flushes for what is a single chunk of output.
+    sys.stdout.write(
+        "Target energy deliveries:\n"
+        + "".join(f"  {target}: {energy}\n" for target, energy in summary["targets"].items())
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
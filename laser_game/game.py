@@ -0,0 +1,1535 @@
+"""Core simulation for the laser puzzle game.
+
+The module is intentionally free of any UI dependencies: it models a
+rectangular board populated with emitters, mirrors, prisms, splitters,
+amplifiers, energy fields, obstacles, bombs and targets, and provides two
+propagation modes:
+
+* :meth:`LaserGame.propagate` — a ticked simulation where every pulse head
+  advances to its next interaction per tick.  This produces the
+  frame-by-frame timeline the UI renders.
+* :meth:`LaserGame.trace` — an instantaneous full-beam walk used by
+  :class:`SolutionValidator` to check a solution's steady-state target
+  deliveries.
+
+The :meth:`LaserGame.step` per-head loop is the compute kernel: it works
+on locals, packed int keys and precomputed tables, and everything
+object-shaped (dataclass boxing, event grouping) happens at its
+boundaries.  Keep it that way — the loop body is deliberately shaped so
+it could be lowered wholesale to a compiled extension without touching
+the surrounding API.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import pickle
+import weakref
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from enum import IntEnum
+from itertools import chain, repeat
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    # orjson parses bytes directly in C, several times faster than the
+    # stdlib; level/solution loading falls back transparently without it.
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+MAX_ENERGY_LEVEL = 16
+DEFAULT_MAX_TICKS = 256
+
+Position = Tuple[int, int]
+
+
+def clamp_energy(value):
+    """Clamp ``value`` into the inclusive range ``[0, MAX_ENERGY_LEVEL]``.
+
+    Non-numeric input (as may appear in hand-edited level files) clamps to 0.
+    """
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return 0
+    return max(0, min(MAX_ENERGY_LEVEL, value))
+
+
+def clamp_energy_fast(value: int) -> int:
+    """Clamp an energy that is already an int.
+
+    The simulation kernel only ever produces ints, so it skips
+    :func:`clamp_energy`'s defensive coercion (and its always-paid
+    try/except setup); the coercing variant stays on the loader path where
+    hand-edited files can put anything in an energy slot.
+    """
+    return 0 if value < 0 else MAX_ENERGY_LEVEL if value > MAX_ENERGY_LEVEL else value
+
+
+class Direction(IntEnum):
+    """A cardinal beam direction.
+
+    An :class:`~enum.IntEnum` with dense ordinals: members index the
+    module-level transition tables directly, key dicts and pack into int
+    signatures at plain-int cost, and hash/compare without Enum overhead.
+    The ``(dx, dy)`` step lives in :data:`_DIR_VEC` (exposed as
+    :attr:`vector`).
+    """
+
+    NORTH = 0
+    EAST = 1
+    SOUTH = 2
+    WEST = 3
+
+    @property
+    def vector(self) -> Tuple[int, int]:
+        return _DIR_VEC[self]
+
+    def turn_left(self) -> "Direction":
+        return _TURN_LEFT[self]
+
+    def turn_right(self) -> "Direction":
+        return _TURN_RIGHT[self]
+
+    def reverse(self) -> "Direction":
+        return _REVERSE[self]
+
+    @classmethod
+    def from_name(cls, name: str) -> "Direction":
+        try:
+            return cls[str(name).upper()]
+        except KeyError:
+            raise ValueError(f"unknown direction {name!r}") from None
+
+
+# Transition tables indexed by the member itself; turn_left/turn_right/
+# reverse and Mirror.reflect all run inside the per-head step loop, where a
+# tuple index beats rebuilding a 4-entry dict per call.
+_TURN_LEFT = (Direction.WEST, Direction.NORTH, Direction.EAST, Direction.SOUTH)
+_TURN_RIGHT = (Direction.EAST, Direction.SOUTH, Direction.WEST, Direction.NORTH)
+_REVERSE = (Direction.SOUTH, Direction.WEST, Direction.NORTH, Direction.EAST)
+_SLASH_REFLECT = (Direction.EAST, Direction.NORTH, Direction.WEST, Direction.SOUTH)
+_BACKSLASH_REFLECT = (Direction.WEST, Direction.SOUTH, Direction.EAST, Direction.NORTH)
+_DIRECTIONS = tuple(Direction)
+_DIR_VEC = ((0, -1), (1, 0), (0, 1), (-1, 0))
+_DIR_NAME = tuple(direction.name for direction in Direction)
+
+# Splitters and prisms have a closed set of 12 (pattern, direction) and
+# (spread, direction) combinations; enumerate their output fans once so a
+# hit is a table lookup instead of building a fresh list of turns.
+_SPLITTER_TABLE: Dict[Tuple[str, int], Tuple[Direction, ...]] = {}
+_PRISM_OUTPUTS: Dict[Tuple[int, int], Tuple[Direction, ...]] = {}
+for _direction in Direction:
+    _left = _direction.turn_left()
+    _right = _direction.turn_right()
+    _SPLITTER_TABLE[("dual", _direction)] = (_left, _right)
+    _SPLITTER_TABLE[("triple", _direction)] = (_direction, _left, _right)
+    _SPLITTER_TABLE[("cross", _direction)] = (_direction, _left, _right, _direction.reverse())
+    _PRISM_OUTPUTS[(1, _direction)] = (_direction,)
+    _PRISM_OUTPUTS[(2, _direction)] = (_left, _right)
+    _PRISM_OUTPUTS[(3, _direction)] = (_direction, _left, _right)
+# Shared pass-through fans so unknown splitter patterns don't allocate a
+# fresh one-tuple on every hit.
+_PASS_THROUGH = tuple((_direction,) for _direction in Direction)
+
+
+@dataclass(slots=True)
+class Mirror:
+    """A 45-degree mirror, oriented ``/`` or ``\\``."""
+
+    orientation: str = "/"
+
+    def __post_init__(self):
+        # Validate once at construction so reflect() is a bare table lookup.
+        if self.orientation not in ("/", "\\"):
+            raise ValueError(f"invalid mirror orientation {self.orientation!r}")
+
+    def reflect(self, direction: Direction) -> Direction:
+        table = _SLASH_REFLECT if self.orientation == "/" else _BACKSLASH_REFLECT
+        return table[direction]
+
+
+@dataclass(slots=True)
+class Prism:
+    """Splits an incoming beam into up to three fanned-out beams."""
+
+    spread: int = 3
+
+    def split(self, direction: Direction) -> Tuple[Direction, ...]:
+        spread = 3 if self.spread >= 3 else 1 if self.spread < 2 else 2
+        return _PRISM_OUTPUTS[(spread, direction)]
+
+
+@dataclass(slots=True)
+class Splitter:
+    """Splits a beam according to a named pattern (dual/triple/cross)."""
+
+    pattern: str = "dual"
+
+
+@dataclass(slots=True)
+class Amplifier:
+    boost: int = 1
+
+
+@dataclass(slots=True)
+class EnergyField:
+    drain: int = 1
+
+
+@dataclass(slots=True)
+class Obstacle:
+    durability: int = 1
+    destructible: bool = True
+
+
+@dataclass(slots=True)
+class Bomb:
+    power: int = 1
+
+
+@dataclass(slots=True)
+class Target:
+    required_energy: int = 1
+
+
+@dataclass(slots=True)
+class LaserEmitter:
+    position: Position
+    direction: Direction
+    energy: int = 8
+    emission_interval: int = 0
+    burst_length: int = 1
+    cooldown: int = 0
+
+
+def _parse_position(raw) -> Position:
+    """Parse a position from ``"x,y"`` strings or ``[x, y]`` sequences."""
+    if isinstance(raw, str):
+        parts = raw.strip("() ").split(",")
+        return (int(parts[0]), int(parts[1]))
+    return (int(raw[0]), int(raw[1]))
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class Level:
+    """A parsed level: board dimensions plus every placed component.
+
+    Frozen with ``__slots__``: the per-instance ``__dict__`` disappears,
+    which matters when validators construct many candidate copies.  The
+    component *containers* stay mutable — placements and obstacle
+    destruction update the dicts in place — only attribute rebinding is
+    forbidden.
+    """
+
+    # Identity hash: the field-based hash a frozen dataclass would generate
+    # cannot work with mutable dict fields, and cache bookkeeping keys off
+    # the instance anyway.
+    __hash__ = object.__hash__
+
+    name: str
+    width: int
+    height: int
+    energy_goal: int = 1
+    max_ticks: int = DEFAULT_MAX_TICKS
+    emitters: List[LaserEmitter] = field(default_factory=list)
+    mirrors: Dict[Position, Mirror] = field(default_factory=dict)
+    prisms: Dict[Position, Prism] = field(default_factory=dict)
+    splitters: Dict[Position, Splitter] = field(default_factory=dict)
+    amplifiers: Dict[Position, Amplifier] = field(default_factory=dict)
+    energy_fields: Dict[Position, EnergyField] = field(default_factory=dict)
+    obstacles: Dict[Position, Obstacle] = field(default_factory=dict)
+    bombs: Dict[Position, Bomb] = field(default_factory=dict)
+    targets: Dict[Position, Target] = field(default_factory=dict)
+
+    def inside(self, position: Position) -> bool:
+        x, y = position
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def clone(self) -> "Level":
+        """An independent working copy for callers that will mutate.
+
+        Only the containers are duplicated; the component instances are
+        shared, since nothing mutates a component that lives on a Level —
+        the simulation copies obstacles into its own active map and
+        placements bind fresh objects.  This replaces a full
+        ``copy.deepcopy`` walk over every component with nine shallow
+        copies.
+        """
+        return Level(
+            name=self.name,
+            width=self.width,
+            height=self.height,
+            energy_goal=self.energy_goal,
+            max_ticks=self.max_ticks,
+            emitters=list(self.emitters),
+            mirrors=dict(self.mirrors),
+            prisms=dict(self.prisms),
+            splitters=dict(self.splitters),
+            amplifiers=dict(self.amplifiers),
+            energy_fields=dict(self.energy_fields),
+            obstacles=dict(self.obstacles),
+            bombs=dict(self.bombs),
+            targets=dict(self.targets),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Level":
+        emitters = [
+            LaserEmitter(
+                position=tuple(item["position"]),
+                direction=Direction.from_name(item.get("direction", "EAST")),
+                energy=clamp_energy(item.get("energy", 8)),
+                emission_interval=int(item.get("emission_interval", 0)),
+                burst_length=int(item.get("burst_length", 1)),
+                cooldown=int(item.get("cooldown", 0)),
+            )
+            for item in data.get("emitters", [])
+        ]
+        return cls(
+            name=data.get("name", "unnamed"),
+            width=int(data["width"]),
+            height=int(data["height"]),
+            energy_goal=int(data.get("energy_goal", 1)),
+            max_ticks=int(data.get("max_ticks", DEFAULT_MAX_TICKS)),
+            emitters=emitters,
+            mirrors={
+                _parse_position(key): Mirror(orientation=value.get("orientation", "/"))
+                for key, value in data.get("mirrors", {}).items()
+            },
+            prisms={
+                _parse_position(key): Prism(spread=int(value.get("spread", 3)))
+                for key, value in data.get("prisms", {}).items()
+            },
+            splitters={
+                _parse_position(key): Splitter(pattern=value.get("pattern", "dual"))
+                for key, value in data.get("splitters", {}).items()
+            },
+            amplifiers={
+                _parse_position(key): Amplifier(boost=int(value.get("boost", 1)))
+                for key, value in data.get("amplifiers", {}).items()
+            },
+            energy_fields={
+                _parse_position(key): EnergyField(drain=int(value.get("drain", 1)))
+                for key, value in data.get("energy_fields", {}).items()
+            },
+            obstacles={
+                _parse_position(key): Obstacle(
+                    durability=int(value.get("durability", 1)),
+                    destructible=bool(value.get("destructible", True)),
+                )
+                for key, value in data.get("obstacles", {}).items()
+            },
+            bombs={
+                _parse_position(key): Bomb(power=int(value.get("power", 1)))
+                for key, value in data.get("bombs", {}).items()
+            },
+            targets={
+                _parse_position(key): Target(required_energy=int(value.get("required_energy", 1)))
+                for key, value in data.get("targets", {}).items()
+            },
+        )
+
+
+@dataclass(slots=True)
+class PulseHead:
+    """The moving tip of a beam in the ticked simulation."""
+
+    position: Position
+    direction: Direction
+    energy: int
+    brightness: float = 1.0
+    source_energy: int = 0
+    phase: int = 0
+    emitter_index: int = 0
+
+
+@dataclass(slots=True)
+class PulseSegment:
+    """One cell-to-cell beam segment, as recorded for rendering/replay."""
+
+    start: Position
+    end: Position
+    direction: Direction
+    energy: int
+    intensity: float
+    tick: int
+    lifetime: int = 1
+    brightness: float = 1.0
+    source_energy: int = 0
+
+
+@dataclass(slots=True)
+class PulseFrame:
+    # ``segments`` holds packed segment tuples (see LaserGame._pack_segment);
+    # PulseSegment objects are only materialised on demand via ``path``.
+    tick: int
+    segments: List[tuple]
+    events: Dict[str, list]
+
+
+@dataclass(slots=True)
+class PulseState:
+    active_heads: List[PulseHead] = field(default_factory=list)
+    loop_detected: bool = False
+    loop_tick: Optional[int] = None
+
+
+@dataclass(slots=True)
+class EmitterRuntime:
+    """Per-run firing bookkeeping for one emitter."""
+
+    emitter: LaserEmitter
+    index: int
+    next_emission: int = 0
+    has_fired: bool = False
+    cycle: int = 0
+
+    def __post_init__(self):
+        # The firing-cycle length is constant per emitter; computing it here
+        # turns the per-tick has_future_activity check into one comparison.
+        emitter = self.emitter
+        self.cycle = max(1, emitter.burst_length + emitter.cooldown, emitter.emission_interval)
+
+    def generate_heads(self, tick: int) -> List[PulseHead]:
+        emitter = self.emitter
+        if emitter.emission_interval <= 0:
+            if self.has_fired:
+                return []
+            self.has_fired = True
+        else:
+            if tick < self.next_emission:
+                return []
+            self.has_fired = True
+            self.next_emission = tick + max(1, emitter.emission_interval)
+        energy = clamp_energy(emitter.energy)
+        brightness = energy / MAX_ENERGY_LEVEL
+        if brightness < 0.1:
+            brightness = 0.1
+        return [
+            PulseHead(
+                position=emitter.position,
+                direction=emitter.direction,
+                energy=energy,
+                brightness=brightness,
+                source_energy=energy,
+                emitter_index=self.index,
+            )
+        ]
+
+    def has_future_activity(self, tick: int) -> bool:
+        if self.emitter.emission_interval <= 0:
+            return not self.has_fired
+        return tick <= self.next_emission + self.cycle
+
+
+def apply_placement_to_level(level: Level, placement: dict) -> None:
+    """Apply one solution/editor placement dict to ``level`` in place."""
+    kind = placement.get("type", "mirror")
+    position = tuple(placement["position"])
+    if kind == "mirror":
+        level.mirrors[position] = Mirror(orientation=placement.get("orientation", "/"))
+    elif kind == "remove_mirror":
+        level.mirrors.pop(position, None)
+    elif kind == "prism":
+        level.prisms[position] = Prism(spread=int(placement.get("spread", 3)))
+    elif kind == "splitter":
+        level.splitters[position] = Splitter(pattern=placement.get("pattern", "dual"))
+    else:
+        raise ValueError(f"unknown placement type {kind!r}")
+
+
+# Manhattan-disk offsets keyed by radius, built on first use.  Bomb powers
+# are tiny, so each disk is a handful of tuples reused by every explosion.
+_DISK_OFFSETS: Dict[int, Tuple[Tuple[int, int], ...]] = {}
+
+
+def _disk_offsets(radius: int) -> Tuple[Tuple[int, int], ...]:
+    offsets = _DISK_OFFSETS.get(radius)
+    if offsets is None:
+        offsets = tuple(
+            (dx, dy)
+            for dx in range(-radius, radius + 1)
+            for dy in range(-(radius - abs(dx)), radius - abs(dx) + 1)
+        )
+        _DISK_OFFSETS[radius] = offsets
+    return offsets
+
+
+# Kind bits for the fused per-cell tile entries built by
+# LaserGame._rebuild_interaction_index.
+_KIND_MIRROR = 1
+_KIND_PRISM = 2
+_KIND_FIELD = 4
+_KIND_TARGET = 8
+_KIND_BOMB = 16
+_KIND_OBSTACLE = 32
+_KIND_AMP = 64
+_KIND_SPLITTER = 128
+
+
+class LaserGame:
+    """Simulates laser propagation on a :class:`Level`."""
+
+    def __init__(
+        self,
+        level: Level,
+        max_ticks: Optional[int] = None,
+        history_limit: Optional[int] = None,
+    ):
+        """``history_limit`` bounds how many segments and frames are
+        retained.  Live-play callers that only render the latest frame can
+        cap it so long (or looping) simulations keep O(limit) memory
+        instead of growing with every tick; replay and payload consumers
+        leave it ``None``.
+        """
+        self.level = level
+        self.max_ticks = max_ticks if max_ticks is not None else level.max_ticks
+        self.history_limit = history_limit
+        self.reset()
+
+    def reset(self) -> None:
+        self.state = PulseState()
+        self.emitter_runtimes = [
+            EmitterRuntime(emitter=emitter, index=index)
+            for index, emitter in enumerate(self.level.emitters)
+        ]
+        # Delivered energy lives in a flat int array indexed y * width + x;
+        # the public target_energy dict is materialised from it on demand.
+        self._target_energy_grid = array("i", [0]) * (self.level.width * self.level.height)
+        # Incremental completion accounting: targets still below their
+        # requirement.  Zero-requirement targets are met from the start.
+        self._unmet_targets = sum(
+            1 for target in self.level.targets.values() if target.required_energy > 0
+        )
+        self._total_target_energy = 0
+        self.active_obstacles = {
+            position: Obstacle(durability=obstacle.durability, destructible=obstacle.destructible)
+            for position, obstacle in self.level.obstacles.items()
+        }
+        self.active_bombs = dict(self.level.bombs)
+        self.destroyed_obstacles: List[Position] = []
+        self.visited_states: Dict[tuple, int] = {}
+        if self.history_limit is None:
+            self._path_raw: List[tuple] = []
+            self.timeline: List[PulseFrame] = []
+        else:
+            self._path_raw = deque(maxlen=self.history_limit)
+            self.timeline = deque(maxlen=self.history_limit)
+        self.accumulated_events = defaultdict(list)
+        # Seed the always-expected kinds so last_events never needs a fix-up.
+        for _kind in ("emissions", "hits", "drops", "explosions"):
+            self.accumulated_events[_kind]
+        # Placements queued before a run survive the reset so they can be
+        # applied on the first tick.
+        self.pending_placements: List[dict] = getattr(self, "pending_placements", [])
+        self.tick = 0
+        self._emitters_exhausted = False
+        self._rebuild_interaction_index()
+
+    # -- placements ---------------------------------------------------------
+
+    def queue_placement(self, placement: dict) -> None:
+        self.pending_placements.append(placement)
+
+    def apply_pending_placements(self) -> None:
+        if not self.pending_placements:
+            return
+        # Swap the queue out in one move instead of pop(0)-shifting the
+        # remainder for every drained entry.
+        pending, self.pending_placements = self.pending_placements, []
+        for placement in pending:
+            apply_placement_to_level(self.level, placement)
+        self._rebuild_interaction_index()
+
+    def _rebuild_interaction_index(self) -> None:
+        """Build the fused tile map and the sorted per-row/per-column
+        coordinate lists of every cell a beam cannot cross without
+        processing.
+
+        ``_tile_grid`` is a flat int array over ``y * width + x`` cells
+        holding 1-based indices into ``_tile_entries``, whose dense tuples
+        are ``(mask, field, target, amplifier, mirror, prism, splitter)``;
+        :meth:`step` resolves a stop with two indexed reads instead of
+        hashing the same position against eight component dicts.  Bombs and
+        obstacles appear only as mask bits because their maps mutate during
+        a run; a set bit still sends the lookup to the live map.
+
+        The row/column lists drive the ray-march bisect.  Removals
+        (destroyed obstacles, spent bombs) leave stale entries behind; a
+        stale entry only costs an extra stop at a now-empty cell, never a
+        skipped interaction, so only placements force a rebuild.
+        """
+        level = self.level
+        entries: Dict[Position, list] = {}
+
+        def entry(position: Position) -> list:
+            return entries.setdefault(position, [0, None, None, None, None, None, None])
+
+        for position, field_ in level.energy_fields.items():
+            slot = entry(position)
+            slot[0] |= _KIND_FIELD
+            slot[1] = field_
+        for position, target in level.targets.items():
+            slot = entry(position)
+            slot[0] |= _KIND_TARGET
+            slot[2] = target
+        for position, amplifier in level.amplifiers.items():
+            slot = entry(position)
+            slot[0] |= _KIND_AMP
+            slot[3] = amplifier
+        for position, mirror in level.mirrors.items():
+            slot = entry(position)
+            slot[0] |= _KIND_MIRROR
+            slot[4] = mirror
+        for position, prism in level.prisms.items():
+            slot = entry(position)
+            slot[0] |= _KIND_PRISM
+            slot[5] = prism
+        for position, splitter in level.splitters.items():
+            slot = entry(position)
+            slot[0] |= _KIND_SPLITTER
+            slot[6] = splitter
+        for position in self.active_bombs:
+            entry(position)[0] |= _KIND_BOMB
+        for position in self.active_obstacles:
+            entry(position)[0] |= _KIND_OBSTACLE
+
+        # Flat SoA layout: one int-per-cell grid holding 1-based indices
+        # into a dense entry list (0 = empty).  A stop costs two C-level
+        # indexed reads — no hashing at all — and the contiguous grid is
+        # what a straight run walks through cache-friendly.
+        width = level.width
+        grid = array("i", [0]) * (width * level.height)
+        tile_entries: List[tuple] = []
+        for (x, y), slot in entries.items():
+            tile_entries.append(tuple(slot))
+            grid[y * width + x] = len(tile_entries)
+        self._tile_grid = grid
+        self._tile_entries = tile_entries
+        rows: List[List[int]] = [[] for _ in range(level.height)]
+        cols: List[List[int]] = [[] for _ in range(level.width)]
+        for x, y in entries:
+            rows[y].append(x)
+            cols[x].append(y)
+        for bucket in rows:
+            bucket.sort()
+        for bucket in cols:
+            bucket.sort()
+        self._row_index = rows
+        self._col_index = cols
+
+    # -- ticked simulation --------------------------------------------------
+
+    def step(self, tick: int) -> PulseFrame:
+        """Advance every active pulse head to its next interaction.
+
+        A head ray-marches along its direction of travel: the interaction
+        index turns an arbitrarily long run of empty cells into one bisect
+        and a single spanning :class:`PulseSegment`.
+        """
+        # Events accumulate in one flat (kind, payload) log and are grouped
+        # once at end of tick; a per-tick defaultdict plus per-kind list
+        # copies was measurable allocator churn.
+        event_log: List[Tuple[str, dict]] = []
+        append_event = event_log.append
+        spawned_heads: List[PulseHead] = []
+        for runtime in self.emitter_runtimes:
+            for head in runtime.generate_heads(tick):
+                spawned_heads.append(head)
+                append_event(
+                    ("emissions", {"position": head.position, "direction": head.direction, "energy": head.energy, "tick": tick})
+                )
+
+        # No copy: the previous head list is replaced wholesale at end of
+        # tick, so chaining (or iterating it directly when nothing spawned)
+        # is safe and skips an O(heads) list build per tick.
+        if spawned_heads:
+            active_heads = chain(self.state.active_heads, spawned_heads)
+        else:
+            active_heads = self.state.active_heads
+
+        new_heads: List[PulseHead] = []
+        segments: List[tuple] = []
+        # The loop below is the simulation kernel.  Alias every map and bound
+        # method it touches as a local once per tick: LOAD_FAST beats the
+        # repeated attribute-chain dispatch on self.level for every head.
+        level = self.level
+        inside = level.inside
+        width, height = level.width, level.height
+        tile_grid = self._tile_grid
+        tile_entries = self._tile_entries
+        active_bombs = self.active_bombs
+        active_obstacles = self.active_obstacles
+        target_energy_grid = self._target_energy_grid
+        visited_states = self.visited_states
+        row_index = self._row_index
+        col_index = self._col_index
+        for head in active_heads:
+            direction = head.direction
+            current_pos = head.position
+            # _DIR_VEC[idx] replaces the .vector property descriptor dispatch
+            # on the hottest arithmetic line of the simulation.
+            dx, dy = _DIR_VEC[direction]
+            next_pos = (current_pos[0] + dx, current_pos[1] + dy)
+            if not inside(next_pos):
+                append_event(("drops", {"position": current_pos, "reason": "off_grid", "tick": tick}))
+                continue
+
+            # Ray-march: jump straight to the next cell that can interact
+            # with the beam, emitting one segment for the whole empty run
+            # instead of one per cell per tick.
+            if dy == 0:
+                bucket = row_index[current_pos[1]]
+                if dx > 0:
+                    index = bisect_left(bucket, next_pos[0])
+                    stop = bucket[index] if index < len(bucket) else None
+                else:
+                    index = bisect_right(bucket, next_pos[0]) - 1
+                    stop = bucket[index] if index >= 0 else None
+                if stop is None:
+                    edge = (width - 1 if dx > 0 else 0, current_pos[1])
+                    segments.append(
+                        self._pack_segment(head, current_pos, edge, direction, head.energy, tick)
+                    )
+                    append_event(("drops", {"position": edge, "reason": "off_grid", "tick": tick}))
+                    continue
+                next_pos = (stop, current_pos[1])
+            else:
+                bucket = col_index[current_pos[0]]
+                if dy > 0:
+                    index = bisect_left(bucket, next_pos[1])
+                    stop = bucket[index] if index < len(bucket) else None
+                else:
+                    index = bisect_right(bucket, next_pos[1]) - 1
+                    stop = bucket[index] if index >= 0 else None
+                if stop is None:
+                    edge = (current_pos[0], height - 1 if dy > 0 else 0)
+                    segments.append(
+                        self._pack_segment(head, current_pos, edge, direction, head.energy, tick)
+                    )
+                    append_event(("drops", {"position": edge, "reason": "off_grid", "tick": tick}))
+                    continue
+                next_pos = (current_pos[0], stop)
+
+            energy = head.energy
+            # Two indexed reads resolve the cell: grid -> entry index
+            # (0 = empty, where stale ray-march stops land) -> fused entry.
+            entry_index = tile_grid[next_pos[1] * width + next_pos[0]]
+            if not entry_index:
+                mirror = prism = splitter = None
+            else:
+                mask, field_, target, amplifier, mirror, prism, splitter = tile_entries[entry_index - 1]
+                if field_ is not None:
+                    energy = clamp_energy_fast(energy - field_.drain)
+                    append_event(("drains", {"position": next_pos, "drain": field_.drain, "tick": tick}))
+
+                if target is not None and energy > 0:
+                    cell = next_pos[1] * width + next_pos[0]
+                    delivered = target_energy_grid[cell] + 1
+                    target_energy_grid[cell] = delivered
+                    if delivered == target.required_energy:
+                        self._unmet_targets -= 1
+                    self._total_target_energy += 1
+                    energy = clamp_energy_fast(energy - 1)
+                    append_event(("hits", {"position": next_pos, "energy": energy, "tick": tick}))
+
+                if mask & _KIND_BOMB:
+                    bomb = active_bombs.get(next_pos)
+                    if bomb is not None:
+                        segments.append(self._pack_segment(head, current_pos, next_pos, direction, energy, tick))
+                        self._trigger_bomb(next_pos, bomb, active_obstacles, tick=tick, events=event_log)
+                        continue
+
+                if mask & _KIND_OBSTACLE:
+                    obstacle = active_obstacles.get(next_pos)
+                    if obstacle is not None:
+                        segments.append(self._pack_segment(head, current_pos, next_pos, direction, energy, tick))
+                        obstacle.durability -= 1
+                        append_event(("obstacles_hit", {"position": next_pos, "durability": obstacle.durability, "tick": tick}))
+                        if obstacle.durability <= 0 and obstacle.destructible:
+                            del active_obstacles[next_pos]
+                            self.destroyed_obstacles.append(next_pos)
+                            append_event(("obstacles_removed", {"position": next_pos, "tick": tick}))
+                        continue
+
+                if amplifier is not None:
+                    energy = clamp_energy_fast(energy + amplifier.boost)
+                    append_event(("amplified", {"position": next_pos, "boost": amplifier.boost, "tick": tick}))
+
+                if mirror is not None:
+                    direction = mirror.reflect(direction)
+
+            segments.append(self._pack_segment(head, current_pos, next_pos, direction, energy, tick))
+
+            if energy <= 0:
+                append_event(("drops", {"position": next_pos, "reason": "exhausted", "tick": tick}))
+                continue
+
+            if prism is not None or splitter is not None:
+                if prism is not None:
+                    outputs = prism.split(direction)
+                else:
+                    outputs = self._splitter_outputs(splitter.pattern, direction)
+                shares = self._split_energy(energy, len(outputs))
+                append_event(
+                    (
+                        "split",
+                        {
+                            "position": next_pos,
+                            "directions": [_DIR_NAME[out] for out in outputs],
+                            "energies": shares,
+                            "tick": tick,
+                        },
+                    )
+                )
+                split_brightness = head.brightness * 0.8
+                if split_brightness < 0.1:
+                    split_brightness = 0.1
+                for out_direction, share in zip(outputs, shares):
+                    if share <= 0:
+                        continue
+                    signature = self._loop_signature(next_pos, out_direction, head.phase + 1)
+                    if signature in visited_states:
+                        self._record_loop(tick, event_log, next_pos)
+                        continue
+                    visited_states[signature] = tick
+                    new_heads.append(
+                        PulseHead(
+                            position=next_pos,
+                            direction=out_direction,
+                            energy=share,
+                            brightness=split_brightness,
+                            source_energy=share if share > head.source_energy else head.source_energy,
+                            phase=head.phase + 1,
+                            emitter_index=head.emitter_index,
+                        )
+                    )
+                continue
+
+            signature = self._loop_signature(next_pos, direction, head.phase)
+            if signature in visited_states:
+                self._record_loop(tick, event_log, next_pos)
+                continue
+            visited_states[signature] = tick
+
+            # The head is not referenced anywhere after this tick, so the
+            # dominant straight-move path updates it in place rather than
+            # paying a seven-field dataclass __init__ per head per tick.
+            head.position = next_pos
+            head.direction = direction
+            head.energy = energy
+            if energy > head.source_energy:
+                head.source_energy = energy
+            new_heads.append(head)
+
+        self.state.active_heads = new_heads
+        self._path_raw.extend(segments)
+        # Group the flat log once; the frame and the accumulated history get
+        # independent lists without an intermediate defaultdict copy.
+        frame_events: Dict[str, list] = {}
+        accumulated = self.accumulated_events
+        for kind, payload in event_log:
+            frame_events.setdefault(kind, []).append(payload)
+            accumulated[kind].append(payload)
+        frame = PulseFrame(tick=tick, segments=segments, events=frame_events)
+        self.timeline.append(frame)
+        return frame
+
+    def propagate(self, max_ticks: Optional[int] = None) -> int:
+        """Run the ticked simulation until completion, exhaustion or the
+        tick limit.  Returns the number of ticks simulated."""
+        self.reset()
+        limit = max_ticks if max_ticks is not None else self.max_ticks
+        tick = 0
+        # One emitter scan per tick: the post-step value feeds both the
+        # early break and the next iteration's loop condition.
+        pending = self._has_pending_activity(0)
+        while tick < limit and (self.state.active_heads or pending):
+            self.apply_pending_placements()
+            self.step(tick)
+            if self._total_target_energy >= self.level.energy_goal and self.required_targets_met():
+                tick += 1
+                break
+            pending = self._has_pending_activity(tick)
+            if not self.state.active_heads and not pending:
+                tick += 1
+                break
+            tick += 1
+        self.tick = tick
+        return tick
+
+    # -- instantaneous trace ------------------------------------------------
+
+    def trace(self) -> Dict[Position, int]:
+        """Walk every emitter's beam to exhaustion in a single pass.
+
+        Unlike :meth:`propagate`, a target absorbs the beam's full remaining
+        energy; the result models the steady-state deliveries a solution is
+        judged against.  Returns the accumulated ``target_energy`` mapping.
+        """
+        self.reset()
+        # Same kernel discipline as step: alias every map and bound method
+        # the walk touches once, outside the loops.
+        level = self.level
+        inside = level.inside
+        energy_fields = level.energy_fields
+        targets = level.targets
+        amplifiers = level.amplifiers
+        mirrors = level.mirrors
+        prisms = level.prisms
+        splitters = level.splitters
+        active_bombs = self.active_bombs
+        active_obstacles = self.active_obstacles
+        target_energy_grid = self._target_energy_grid
+        path_append = self._path_raw.append
+        width = level.width
+        step_budget = width * level.height * 4
+        queue = deque(
+            (emitter.position, emitter.direction, clamp_energy(emitter.energy))
+            for emitter in level.emitters
+        )
+        # Visited states are keyed by a single packed int (cell * 4 + dir),
+        # mirroring _loop_signature: hashing one small int beats hashing a
+        # nested ((x, y), Direction) tuple on every dequeued walk.
+        visited: Dict[int, int] = {}
+        # Per-level specialization: most levels use a small subset of the
+        # component types, so bake the level's profile into local flags and
+        # skip the dict probes for component classes that cannot occur.
+        # (Bombs and obstacles can only shrink mid-run, so a stale True just
+        # means a probe into a near-empty dict.)
+        has_fields = bool(energy_fields)
+        has_targets = bool(targets)
+        has_bombs = bool(active_bombs)
+        has_obstacles = bool(active_obstacles)
+        has_amplifiers = bool(amplifiers)
+        has_mirrors = bool(mirrors)
+        has_splitting = bool(prisms) or bool(splitters)
+        while queue:
+            position, direction, energy = queue.popleft()
+            state_key = (position[1] * width + position[0]) * 4 + direction
+            if visited.get(state_key, -1) >= energy:
+                continue
+            visited[state_key] = energy
+
+            current = position
+            current_direction = direction
+            current_energy = energy
+            steps = 0
+            while current_energy > 0:
+                steps += 1
+                if steps > step_budget:
+                    self.state.loop_detected = True
+                    break
+                dx, dy = _DIR_VEC[current_direction]
+                next_pos = (current[0] + dx, current[1] + dy)
+                if not inside(next_pos):
+                    break
+
+                if has_fields:
+                    field_ = energy_fields.get(next_pos)
+                    if field_ is not None:
+                        current_energy = clamp_energy_fast(current_energy - field_.drain)
+                        if current_energy <= 0:
+                            break
+
+                path_append(
+                    self._pack_trace_segment(current, next_pos, current_direction, current_energy)
+                )
+
+                target = targets.get(next_pos) if has_targets else None
+                if target is not None:
+                    cell = next_pos[1] * width + next_pos[0]
+                    before = target_energy_grid[cell]
+                    delivered = before + current_energy
+                    target_energy_grid[cell] = delivered
+                    if before < target.required_energy <= delivered:
+                        self._unmet_targets -= 1
+                    self._total_target_energy += current_energy
+                    break
+
+                bomb = active_bombs.get(next_pos) if has_bombs else None
+                if bomb is not None:
+                    event_log: List[Tuple[str, dict]] = []
+                    self._trigger_bomb(next_pos, bomb, active_obstacles, tick=0, events=event_log)
+                    for kind, payload in event_log:
+                        self.accumulated_events[kind].append(payload)
+                    break
+
+                obstacle = active_obstacles.get(next_pos) if has_obstacles else None
+                if obstacle is not None:
+                    obstacle.durability -= 1
+                    if obstacle.durability <= 0 and obstacle.destructible:
+                        del active_obstacles[next_pos]
+                        self.destroyed_obstacles.append(next_pos)
+                    break
+
+                if has_amplifiers:
+                    amplifier = amplifiers.get(next_pos)
+                    if amplifier is not None:
+                        current_energy = clamp_energy_fast(current_energy + amplifier.boost)
+
+                mirror = mirrors.get(next_pos) if has_mirrors else None
+                if mirror is not None:
+                    current_direction = mirror.reflect(current_direction)
+                    # Dedup inside the walk, not just at the queue: a beam
+                    # looping through a mirror ring re-enters a reflected
+                    # state it already traced, so break instead of emitting
+                    # the same segment run until the step budget trips.
+                    # Mirrors are the only in-walk direction changers, so
+                    # checking here is enough to cut every cycle short.
+                    state_key = (next_pos[1] * width + next_pos[0]) * 4 + current_direction
+                    if visited.get(state_key, -1) >= current_energy:
+                        break
+                    visited[state_key] = current_energy
+                    current = next_pos
+                    continue
+
+                if has_splitting:
+                    prism = prisms.get(next_pos)
+                    splitter = splitters.get(next_pos)
+                else:
+                    prism = splitter = None
+                if prism is not None or splitter is not None:
+                    if prism is not None:
+                        outputs = prism.split(current_direction)
+                    else:
+                        outputs = self._splitter_outputs(splitter.pattern, current_direction)
+                    shares = self._split_energy(current_energy, len(outputs))
+                    for out_direction, share in zip(outputs, shares):
+                        if share > 0:
+                            queue.append((next_pos, out_direction, share))
+                    break
+
+                current = next_pos
+        return self.target_energy
+
+    @property
+    def last_events(self) -> Dict[str, list]:
+        """The accumulated event history, grouped per kind.
+
+        A plain-dict view over the live per-kind lists — no copies, since
+        the simulation only ever appends and readers (the playthrough
+        payload) never mutate.  Callers that need an independent snapshot
+        should copy the lists themselves.  The four always-expected kinds
+        are seeded at reset, so they are present even when empty.
+        """
+        return dict(self.accumulated_events)
+
+    @property
+    def target_energy(self) -> Dict[Position, int]:
+        """Delivered energy per target cell.
+
+        Materialised from the flat per-cell grid on access; the hit paths
+        only ever touch the grid, so reading this mid-run is cheap but the
+        dict is a snapshot, not a live view.
+        """
+        grid = self._target_energy_grid
+        width = self.level.width
+        return {
+            position: grid[position[1] * width + position[0]]
+            for position in self.level.targets
+        }
+
+    # -- completion ---------------------------------------------------------
+
+    def required_targets_met(self) -> bool:
+        # O(1): the hit paths decrement _unmet_targets whenever a target
+        # crosses its requirement, so the per-tick completion check never
+        # re-scans the targets dict.
+        return self._unmet_targets == 0
+
+    def level_complete(self) -> bool:
+        return self.required_targets_met() and self._total_target_energy >= self.level.energy_goal
+
+    # -- playthrough payload ------------------------------------------------
+
+    def playthrough(self) -> dict:
+        """Build the serialisable payload consumed by the demo and the UI."""
+        # The frames and the accumulated history reference the *same* event
+        # payload dicts, so a per-call memo keyed by id() normalises each
+        # one exactly once; hoisting the bound methods saves an attribute
+        # lookup per element.
+        segment_payload = self._segment_payload
+        normalise = self._normalise_event
+        memo: Dict[int, object] = {}
+        timeline_payload = []
+        for frame in self.timeline:
+            frame_events: Dict[str, list] = {}
+            for key, value in frame.events.items():
+                normalised = frame_events[key] = []
+                for event in value:
+                    event_id = id(event)
+                    if event_id not in memo:
+                        memo[event_id] = normalise(event)
+                    normalised.append(memo[event_id])
+            timeline_payload.append(
+                {
+                    "tick": frame.tick,
+                    "segments": [segment_payload(segment) for segment in frame.segments],
+                    "events": frame_events,
+                }
+            )
+        events_payload = {}
+        for key, value in self.last_events.items():
+            normalised = events_payload[key] = []
+            for event in value:
+                event_id = id(event)
+                if event_id not in memo:
+                    memo[event_id] = normalise(event)
+                normalised.append(memo[event_id])
+        return {
+            "metadata": {
+                "name": self.level.name,
+                "ticks": self.tick,
+                "loop_detected": self.state.loop_detected,
+                "energy_goal": self.level.energy_goal,
+                "complete": self.level_complete(),
+            },
+            "path": [segment_payload(segment) for segment in self._path_raw],
+            "targets": {position: energy for position, energy in self.target_energy.items()},
+            "timeline": timeline_payload,
+            "events": events_payload,
+        }
+
+    @property
+    def path(self) -> List[PulseSegment]:
+        """The recorded beam path as :class:`PulseSegment` objects.
+
+        Segments are stored internally as packed tuples; the dataclass
+        boxing only happens here, for callers that ask for it.
+        """
+        materialise = self._materialise_segment
+        return [materialise(raw) for raw in self._path_raw]
+
+    def iter_segments(self):
+        """Yield segment payloads lazily, without materialising a list."""
+        for segment in self._path_raw:
+            yield self._segment_payload(segment)
+
+    def playthrough_summary(self) -> dict:
+        """A compact playthrough result for callers that only need counts.
+
+        Unlike :meth:`playthrough` this never materialises the per-segment
+        payload list or the timeline, so peak memory stays O(1) in segment
+        count.
+        """
+        segment_count = len(self._path_raw)
+        return {
+            "metadata": {
+                "name": self.level.name,
+                "ticks": self.tick,
+                "loop_detected": self.state.loop_detected,
+                "energy_goal": self.level.energy_goal,
+                "complete": self.level_complete(),
+            },
+            "targets": {position: energy for position, energy in self.target_energy.items()},
+            "segment_count": segment_count,
+        }
+
+    def _segment_payload(self, segment: tuple) -> dict:
+        start, end, dir_idx, energy, intensity, tick = segment[:6]
+        return {
+            "start": list(start),
+            "end": list(end),
+            "direction": _DIR_NAME[dir_idx],
+            "energy": energy,
+            "intensity": round(intensity, 3),
+            "tick": tick,
+        }
+
+    def _normalise_event(self, event):
+        if isinstance(event, dict):
+            return {key: self._normalise_event(value) for key, value in event.items()}
+        if isinstance(event, (list, tuple)):
+            return [self._normalise_event(item) for item in event]
+        if isinstance(event, Direction):
+            return event.name
+        return event
+
+    # -- internals ----------------------------------------------------------
+
+    def _pack_segment(self, head, start, end, direction, energy, tick) -> tuple:
+        # Conditional expressions instead of max/min: the builtins pay
+        # variadic call overhead on every segment.
+        source_energy = head.source_energy
+        intensity = head.brightness * (energy / (source_energy if source_energy > 1 else 1))
+        segment_intensity = 0.2 if intensity < 0.2 else 1.8 if intensity > 1.8 else intensity
+        return (
+            start,
+            end,
+            direction,
+            energy,
+            segment_intensity,
+            tick,
+            head.brightness,
+            head.source_energy,
+        )
+
+    def _pack_trace_segment(self, start, end, direction, energy) -> tuple:
+        intensity = energy / MAX_ENERGY_LEVEL * 1.8
+        intensity = 0.2 if intensity < 0.2 else 1.8 if intensity > 1.8 else intensity
+        return (start, end, direction, energy, intensity, 0, 1.0, energy)
+
+    @staticmethod
+    def _materialise_segment(raw: tuple) -> PulseSegment:
+        start, end, dir_idx, energy, intensity, tick, brightness, source_energy = raw
+        return PulseSegment(
+            start=start,
+            end=end,
+            direction=_DIRECTIONS[dir_idx],
+            energy=energy,
+            intensity=intensity,
+            tick=tick,
+            brightness=brightness,
+            source_energy=source_energy,
+        )
+
+    @staticmethod
+    def _split_energy(energy: int, parts: int) -> List[int]:
+        if parts <= 0:
+            return []
+        base, remainder = divmod(energy, parts)
+        return [clamp_energy_fast(base + (1 if index < remainder else 0)) for index in range(parts)]
+
+    @staticmethod
+    def _splitter_outputs(pattern: str, direction: Direction) -> Tuple[Direction, ...]:
+        outputs = _SPLITTER_TABLE.get((pattern, direction))
+        if outputs is None:
+            # Cold path: mixed-case pattern names, or unknown patterns which
+            # pass the beam straight through.
+            outputs = _SPLITTER_TABLE.get((pattern.lower(), direction))
+            if outputs is None:
+                return _PASS_THROUGH[direction]
+        return outputs
+
+    def _loop_signature(self, position: Position, direction: Direction, phase: int) -> int:
+        # Packed (cell << 20 | dir << 18 | phase): one small-int key per
+        # visited state instead of a nested tuple holding four objects.
+        # Phases wrap at 2**18, far beyond any reachable split depth.
+        return (
+            ((position[1] * self.level.width + position[0]) << 20)
+            | (direction << 18)
+            | (phase & 0x3FFFF)
+        )
+
+    def _record_loop(self, tick: int, events, position: Position) -> None:
+        self.state.loop_detected = True
+        if self.state.loop_tick is None:
+            self.state.loop_tick = tick
+        events.append(("loops", {"position": position, "tick": tick}))
+
+    def _trigger_bomb(self, position: Position, bomb: Bomb, obstacles_map, tick: int, events) -> None:
+        if position not in self.active_bombs:
+            return
+        del self.active_bombs[position]
+        # Probe the precomputed Manhattan disk instead of scanning every
+        # obstacle and bomb on the board: O(power^2) dict hits, independent
+        # of how cluttered the level is.
+        offsets = _disk_offsets(bomb.power)
+        cx, cy = position
+        affected: List[Position] = []
+        if len(obstacles_map) < len(offsets):
+            # Sparse board: scanning the few remaining obstacles beats
+            # probing every cell of a large blast disk.  Collect first —
+            # no key-list copy — and delete after the scan.
+            power = bomb.power
+            for obstacle_pos, obstacle in obstacles_map.items():
+                if (
+                    abs(obstacle_pos[0] - cx) + abs(obstacle_pos[1] - cy) <= power
+                    and obstacle.destructible
+                ):
+                    affected.append(obstacle_pos)
+            for obstacle_pos in affected:
+                del obstacles_map[obstacle_pos]
+                self.destroyed_obstacles.append(obstacle_pos)
+        else:
+            for dx, dy in offsets:
+                obstacle_pos = (cx + dx, cy + dy)
+                obstacle = obstacles_map.get(obstacle_pos)
+                if obstacle is not None and obstacle.destructible:
+                    del obstacles_map[obstacle_pos]
+                    affected.append(obstacle_pos)
+                    self.destroyed_obstacles.append(obstacle_pos)
+        events.append(
+            ("explosions", {"position": position, "power": bomb.power, "destroyed": list(affected), "tick": tick})
+        )
+        for dx, dy in offsets:
+            other_pos = (cx + dx, cy + dy)
+            other = self.active_bombs.get(other_pos)
+            if other is not None:
+                self._trigger_bomb(other_pos, other, obstacles_map, tick=tick, events=events)
+
+    def _has_pending_activity(self, tick: int) -> bool:
+        if self._emitters_exhausted:
+            return False
+        for runtime in self.emitter_runtimes:
+            if runtime.has_future_activity(tick):
+                return True
+        # A fired single-shot emitter never wakes up again; once every
+        # emitter is in that state, skip the scan for the rest of the run.
+        if all(
+            runtime.emitter.emission_interval <= 0 and runtime.has_fired
+            for runtime in self.emitter_runtimes
+        ):
+            self._emitters_exhausted = True
+        return False
+
+
+# Parsed-artifact caches keyed by (path, mtime_ns).  Warm repeat loads — the
+# demo CLI, retries, parametrized tests — skip the read-and-parse step
+# entirely; a changed file gets a fresh stamp and falls through to a reparse.
+_LEVEL_CACHE: Dict[Tuple[str, int], "Level"] = {}
+_SOLUTION_CACHE: Dict[Tuple[str, int], "Solution"] = {}
+
+
+def _disk_cache_dir() -> Path:
+    override = os.environ.get("LASER_GAME_CACHE_DIR")
+    if override:
+        return Path(override)
+    return Path.home() / ".cache" / "laser_game"
+
+
+def _disk_cache_enabled() -> bool:
+    return os.environ.get("LASER_GAME_DISK_CACHE") == "1"
+
+
+def _json_loads(raw: bytes):
+    """Decode JSON bytes via orjson when available, stdlib otherwise."""
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _disk_cached_parse(path: Path, parse):
+    """Parse ``path`` via the content-hash pickle cache when enabled.
+
+    The cache lives under ``~/.cache/laser_game`` (override with
+    ``LASER_GAME_CACHE_DIR``) and is keyed by a blake2b digest of the file
+    bytes, so stale entries are simply never hit.  Any cache I/O failure
+    falls back to a plain parse.
+    """
+    raw = path.read_bytes()
+    if not _disk_cache_enabled():
+        return parse(raw)
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    cache_path = _disk_cache_dir() / f"{path.stem}-{digest}.pkl"
+    try:
+        return pickle.loads(cache_path.read_bytes())
+    except (OSError, pickle.PickleError):
+        pass
+    parsed = parse(raw)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(pickle.dumps(parsed))
+    except OSError:
+        pass
+    return parsed
+
+
+class LevelLoader:
+    """Loads :class:`Level` objects from JSON files in a directory.
+
+    Parsed levels are cached module-wide by ``(path, mtime_ns)`` — repeat
+    loads of an unchanged file (parametrized tests, the demo CLI) skip the
+    read and parse entirely, and editing a file on disk naturally falls
+    through to a reparse.  Every call returns an independent
+    :meth:`Level.clone` of the cached template, so callers can mutate
+    their copy freely.
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def load(self, name: str) -> Level:
+        path = self.root / f"{name}.json"
+        stamp = (str(path), path.stat().st_mtime_ns)
+        cached = _LEVEL_CACHE.get(stamp)
+        if cached is None:
+            cached = _disk_cached_parse(path, lambda raw: Level.from_dict(_json_loads(raw)))
+            _LEVEL_CACHE[stamp] = cached
+        # Callers mutate levels (placements, obstacle destruction), so each
+        # load hands out an independent clone of the cached template.
+        return cached.clone()
+
+
+@dataclass
+class Solution:
+    """A solution file: placements to apply plus the expected deliveries."""
+
+    name: str
+    placements: List[dict] = field(default_factory=list)
+    expected_targets: Dict[str, int] = field(default_factory=dict)
+    # expected_targets with its "x,y" keys parsed to positions, filled at
+    # load time so repeated validate() calls never re-split the strings.
+    parsed_expected: Dict[Position, int] = field(default_factory=dict)
+
+
+@dataclass
+class ValidationReport:
+    valid: bool
+    target_energy: Dict[Position, int]
+    expected: Dict[Position, int]
+    mismatches: Dict[Position, Tuple[int, int]]
+
+
+# Tracks which placements have already been applied to a Level instance, so
+# re-applying the same solution can skip the deep copy.  Kept outside the
+# (slotted) Level type; entries vanish with their level.
+_APPLIED_SOLUTIONS = weakref.WeakKeyDictionary()
+
+
+def _placements_key(placements: List[dict]) -> str:
+    return json.dumps(placements, sort_keys=True)
+
+
+def _level_fingerprint(level: Level) -> tuple:
+    """A hashable snapshot of everything that influences a trace.
+
+    Building it is O(components) — orders of magnitude cheaper than the
+    O(cells-walked) trace it lets :meth:`SolutionValidator.validate` skip —
+    and it keys by *content*, so a mutated clone never aliases the
+    original's cached result.
+    """
+    return (
+        level.name,
+        level.width,
+        level.height,
+        level.energy_goal,
+        tuple(
+            (e.position, e.direction, e.energy, e.emission_interval, e.burst_length, e.cooldown)
+            for e in level.emitters
+        ),
+        tuple(sorted((pos, m.orientation) for pos, m in level.mirrors.items())),
+        tuple(sorted((pos, p.spread) for pos, p in level.prisms.items())),
+        tuple(sorted((pos, s.pattern) for pos, s in level.splitters.items())),
+        tuple(sorted((pos, a.boost) for pos, a in level.amplifiers.items())),
+        tuple(sorted((pos, f.drain) for pos, f in level.energy_fields.items())),
+        tuple(sorted((pos, o.durability, o.destructible) for pos, o in level.obstacles.items())),
+        tuple(sorted((pos, b.power) for pos, b in level.bombs.items())),
+        tuple(sorted((pos, t.required_energy) for pos, t in level.targets.items())),
+    )
+
+
+class SolutionValidator:
+    """Loads solutions and checks them against a level's trace results."""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        # Trace results keyed by level content: sweeps that validate many
+        # solutions against the same solved board re-use the walk.
+        self._trace_cache: Dict[tuple, Dict[Position, int]] = {}
+
+    def load_solution(self, name: str) -> Solution:
+        path = self.root / f"{name}.json"
+        stamp = (str(path), path.stat().st_mtime_ns)
+        cached = _SOLUTION_CACHE.get(stamp)
+        if cached is None:
+
+            def parse(raw):
+                data = _json_loads(raw)
+                expected_targets = dict(data.get("expected_targets", {}))
+                return Solution(
+                    name=name,
+                    placements=list(data.get("placements", [])),
+                    expected_targets=expected_targets,
+                    parsed_expected={
+                        _parse_position(key): int(value)
+                        for key, value in expected_targets.items()
+                    },
+                )
+
+            cached = _disk_cached_parse(path, parse)
+            _SOLUTION_CACHE[stamp] = cached
+        return copy.deepcopy(cached)
+
+    def apply_solution(self, level: Level, solution: Solution) -> Level:
+        # Cheap prechecks before the O(cells) clone: nothing to place, or
+        # this exact placement set was already applied to this instance.
+        if not solution.placements:
+            return level
+        key = _placements_key(solution.placements)
+        if _APPLIED_SOLUTIONS.get(level) == key:
+            return level
+        level = level.clone()
+        for placement in solution.placements:
+            apply_placement_to_level(level, placement)
+        _APPLIED_SOLUTIONS[level] = key
+        return level
+
+    def validate(self, level: Level, solution: Solution) -> ValidationReport:
+        level = self.apply_solution(level, solution)
+        fingerprint = _level_fingerprint(level)
+        target_energy = self._trace_cache.get(fingerprint)
+        if target_energy is None:
+            game = LaserGame(level)
+            game.trace()
+            target_energy = game.target_energy
+            self._trace_cache[fingerprint] = target_energy
+        expected = solution.parsed_expected
+        if not expected and solution.expected_targets:
+            # Hand-built Solution objects may carry only the raw string keys.
+            expected = {
+                _parse_position(key): int(value)
+                for key, value in solution.expected_targets.items()
+            }
+        mismatches = {}
+        for position, required in expected.items():
+            actual = target_energy.get(position, 0)
+            if actual != required:
+                mismatches[position] = (required, actual)
+        return ValidationReport(
+            valid=not mismatches,
+            target_energy=dict(target_energy),
+            expected=dict(expected),
+            mismatches=mismatches,
+        )
+
+
+def _propagate_one(level_path: str, placements: List[dict], max_ticks: Optional[int]) -> dict:
+    """Worker for :func:`propagate_many`: one level run, compact result."""
+    path = Path(level_path)
+    level = LevelLoader(path.parent).load(path.stem)
+    game = LaserGame(level, max_ticks=max_ticks)
+    for placement in placements:
+        game.queue_placement(placement)
+    ticks = game.propagate()
+    return {
+        "target_energy": game.target_energy,
+        "complete": game.level_complete(),
+        "loop_detected": game.state.loop_detected,
+        "ticks": ticks,
+    }
+
+
+def propagate_many(
+    level_path,
+    placement_batches: List[List[dict]],
+    max_ticks: Optional[int] = None,
+    n_jobs: Optional[int] = None,
+) -> List[dict]:
+    """Run independent placement batches against one level across cores.
+
+    Placement fuzzing and batch solution sweeps are embarrassingly parallel
+    but GIL-bound in a single process.  Each batch runs in its own worker
+    against a fresh load of ``level_path`` and returns only the compact
+    result dict from :func:`_propagate_one`, so inter-process pickling
+    stays cheap.  Results keep the order of ``placement_batches``.
+
+    ``n_jobs`` defaults to the executor's worker count (CPU count); pass
+    ``n_jobs=1`` to run serially in-process, which single-batch calls do
+    anyway.
+    """
+    batches = [list(batch) for batch in placement_batches]
+    level_path = str(level_path)
+    if (n_jobs is not None and n_jobs <= 1) or len(batches) <= 1:
+        return [_propagate_one(level_path, batch, max_ticks) for batch in batches]
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+        return list(pool.map(_propagate_one, repeat(level_path), batches, repeat(max_ticks)))
@@ -0,0 +1,45 @@
+"""pygame front-end for the laser game.
+
+Only the lightweight CLI/directory helpers from :mod:`.main` are imported
+eagerly; the rendering classes pull in pygame (and, transitively, the SVG
+backends), so they resolve lazily via PEP 562 ``__getattr__`` on first
+access.
+"""
+
+from .main import (
+    ASSET_ENV_VAR,
+    LEVEL_ENV_VAR,
+    UIDirectories,
+    bootstrap_directories,
+    main,
+    resolve_directories,
+    run,
+)
+
+__all__ = [
+    "ASSET_ENV_VAR",
+    "LEVEL_ENV_VAR",
+    "UIDirectories",
+    "LaserGameApp",
+    "LaserGameUI",
+    "bootstrap_directories",
+    "main",
+    "resolve_directories",
+    "run",
+]
+
+_LAZY_TOOLKIT = ("LaserGameApp", "LaserGameUI")
+
+
+def __getattr__(name):
+    if name in _LAZY_TOOLKIT:
+        from . import toolkit
+
+        value = getattr(toolkit, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_TOOLKIT))
@@ -0,0 +1,169 @@
+"""SVG asset loading for the pygame front-end.
+
+Rasterisation prefers an SVG-capable backend (Qt, then cairosvg); when
+neither is installed we fall back to flat-colour placeholder tiles so the UI
+and its tests work without optional dependencies.
+"""
+
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import pygame
+
+ASSET_FILES = {
+    "emitter": "emitter.svg",
+    "target": "target.svg",
+    "mirror": "mirror.svg",
+    "splitter": "splitter.svg",
+}
+DEFAULT_ASSET_SIZE = 32
+
+_FALLBACK_COLOURS = {
+    "emitter": (239, 191, 66, 255),
+    "target": (90, 200, 120, 255),
+    "mirror": (160, 200, 255, 255),
+    "splitter": (200, 120, 220, 255),
+}
+
+
+def _asset_root() -> Path:
+    return Path(__file__).resolve().parents[1] / "assets"
+
+
+def _render_with_qt(path: Path, size: int):
+    from PyQt5.QtCore import Qt  # noqa: F401  (optional dependency)
+    from PyQt5.QtGui import QImage, QPainter
+    from PyQt5.QtSvg import QSvgRenderer
+
+    renderer = QSvgRenderer(str(path))
+    image = QImage(size, size, QImage.Format_ARGB32)
+    image.fill(0)
+    painter = QPainter(image)
+    renderer.render(painter)
+    painter.end()
+    ptr = image.bits()
+    ptr.setsize(image.byteCount())
+    # bytes(ptr) materialises the pixels, and convert_alpha() allocates a
+    # fresh pygame-owned surface, so nothing here aliases Qt memory — no
+    # defensive copy needed on top.
+    buffer = bytes(ptr)
+    return pygame.image.frombuffer(buffer, (size, size), "BGRA").convert_alpha()
+
+
+def _render_with_cairosvg(path: Path, size: int):
+    import cairosvg  # optional dependency
+
+    png_bytes = cairosvg.svg2png(url=str(path), output_width=size, output_height=size)
+    return pygame.image.load(io.BytesIO(png_bytes))
+
+
+def _render_fallback(name: str, size: int):
+    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    surface.fill(_FALLBACK_COLOURS.get(name, (128, 128, 128, 255)))
+    return surface
+
+
+@lru_cache(maxsize=64)
+def _render_master(path_str: str, size: int, mtime_ns: int, name: str):
+    """Rasterise once per (path, size, mtime) and keep the master surface.
+
+    The full SVG parse + raster pass dominates asset loading; repeat loads
+    at the same size (every UI construction, every snapshot test) hit the
+    cache instead.  ``mtime_ns`` is only part of the key so an edited file
+    falls through to a fresh raster.  Callers must ``copy()`` the master
+    before blitting onto it.
+    """
+    path = Path(path_str)
+    for backend, renderer in (("qt", _render_with_qt), ("cairosvg", _render_with_cairosvg)):
+        try:
+            return renderer(path, size), backend
+        except Exception:
+            continue
+    return _render_fallback(name, size), "fallback"
+
+
+def _file_stamp(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _rasterise(path: Path, size: int, name: str):
+    surface, backend = _render_master(str(path), size, _file_stamp(path), name)
+    return surface.copy(), backend
+
+
+def rasterise_svg(path: Path, size: int, name: Optional[str] = None):
+    """Rasterise ``path`` to a ``size``-square pygame surface."""
+    path = Path(path)
+    surface, _ = _rasterise(path, size, name or path.stem)
+    return surface
+
+
+@dataclass
+class AssetLibrary:
+    """Rasterised assets packed into one contiguous RGBA byte buffer.
+
+    One Python object and one allocation for the whole pack instead of a
+    Surface per asset; ``library[name]`` wraps the relevant buffer slice
+    in a fresh surface on demand, and copying the entire library between
+    caches is a single ``bytes`` copy.
+    """
+
+    buffer: bytes
+    index: Dict[str, int]
+    backend: str
+    size: int
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def __getitem__(self, name: str):
+        offset = self.index[name]
+        span = self.size * self.size * 4
+        view = memoryview(self.buffer)[offset : offset + span]
+        return pygame.image.frombuffer(view, (self.size, self.size), "RGBA")
+
+    @property
+    def surfaces(self) -> Dict[str, object]:
+        """Fresh per-asset surfaces, materialised from the packed buffer."""
+        return {name: self[name] for name in self.index}
+
+
+def load_svg_assets(
+    root=None, size: int = DEFAULT_ASSET_SIZE, names: Optional[Iterable[str]] = None
+) -> AssetLibrary:
+    """Load (and rasterise) the named assets from ``root``."""
+    root = Path(root) if root is not None else _asset_root()
+    if names is None:
+        names = list(ASSET_FILES)
+    names = list(names)
+
+    def _raster(name):
+        path = root / ASSET_FILES[name]
+        return _render_master(str(path), size, _file_stamp(path), name)
+
+    # The SVG backends do their rasterising in C with the GIL released, so
+    # cold loads of multi-asset packs scale across threads; warm loads hit
+    # the master cache and the pool never earns its keep, hence the guard.
+    if len(names) > 1 and not _render_master.cache_info().currsize:
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1, len(names))) as pool:
+            rendered = list(pool.map(_raster, names))
+    else:
+        rendered = [_raster(name) for name in names]
+
+    buffer = bytearray()
+    index: Dict[str, int] = {}
+    backend = "fallback"
+    for name, (surface, used) in zip(names, rendered):
+        index[name] = len(buffer)
+        buffer += pygame.image.tostring(surface, "RGBA")
+        if used != "fallback":
+            backend = used
+    return AssetLibrary(buffer=bytes(buffer), index=index, backend=backend, size=size)
@@ -0,0 +1,72 @@
+"""Screen-layout helpers for the pygame front-end."""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Tuple
+
+DEFAULT_CELL_SIZE = 24
+GRID_MARGIN = 40
+HUD_HEIGHT = 96
+MIN_SCREEN_WIDTH = 320
+MIN_SCREEN_HEIGHT = 240
+
+
+@dataclass(frozen=True, slots=True)
+class GridGeometry:
+    """Pixel-space placement of the level grid on screen.
+
+    Frozen so cached instances can be shared safely between UIs; slotted,
+    with the origin unpacked into scalar fields, so the cell-to-pixel
+    transforms on the frame path read slots instead of tuple indices.
+    """
+
+    origin: Tuple[int, int]
+    cell_size: int
+    columns: int
+    rows: int
+    _origin_x: int = field(init=False, repr=False, compare=False)
+    _origin_y: int = field(init=False, repr=False, compare=False)
+    _half: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_origin_x", self.origin[0])
+        object.__setattr__(self, "_origin_y", self.origin[1])
+        object.__setattr__(self, "_half", self.cell_size // 2)
+
+    def cell_to_topleft(self, cell: Tuple[int, int]) -> Tuple[int, int]:
+        return (self._origin_x + cell[0] * self.cell_size, self._origin_y + cell[1] * self.cell_size)
+
+    def cell_to_center(self, cell: Tuple[int, int]) -> Tuple[int, int]:
+        half = self._half
+        return (
+            self._origin_x + cell[0] * self.cell_size + half,
+            self._origin_y + cell[1] * self.cell_size + half,
+        )
+
+    @property
+    def pixel_size(self) -> Tuple[int, int]:
+        return (self.columns * self.cell_size, self.rows * self.cell_size)
+
+
+@lru_cache(maxsize=32)
+def compute_geometry(level_width: int, level_height: int, cell_size: int = DEFAULT_CELL_SIZE) -> GridGeometry:
+    """Compute the grid placement for a board of the given dimensions.
+
+    Cached: the UI recomputes geometry on every playthrough refresh and
+    level switch, but only ever sees a handful of distinct board shapes.
+    """
+    return GridGeometry(
+        origin=(GRID_MARGIN, GRID_MARGIN),
+        cell_size=cell_size,
+        columns=level_width,
+        rows=level_height,
+    )
+
+
+def screen_size_for(geometry: GridGeometry) -> Tuple[int, int]:
+    """The window size needed to fit ``geometry`` plus margins and the HUD."""
+    width, height = geometry.pixel_size
+    return (
+        max(MIN_SCREEN_WIDTH, width + 2 * GRID_MARGIN),
+        max(MIN_SCREEN_HEIGHT, height + 2 * GRID_MARGIN + HUD_HEIGHT),
+    )
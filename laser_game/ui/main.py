@@ -0,0 +1,81 @@
+"""CLI entry point and directory resolution for the UI."""
+
+import argparse
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+ASSET_ENV_VAR = "LASER_GAME_ASSET_DIR"
+LEVEL_ENV_VAR = "LASER_GAME_LEVEL_DIR"
+
+
+@dataclass
+class UIDirectories:
+    """Resolved asset and level directories for a UI session."""
+
+    assets: Path
+    levels: Path
+
+
+@lru_cache(maxsize=None)
+def _default_asset_root() -> Path:
+    return Path(__file__).resolve().parents[1] / "assets"
+
+
+@lru_cache(maxsize=None)
+def _default_level_root() -> Path:
+    return Path(__file__).resolve().parents[1] / "levels"
+
+
+@lru_cache(maxsize=None)
+def _resolve_cached(asset_override, level_override, check_exists: bool) -> UIDirectories:
+    # The environment overrides are part of the cache key, so a changed (or
+    # monkeypatched) environment naturally misses; only the Path.resolve()
+    # and exists() syscalls for an identical configuration are skipped.
+    assets = Path(asset_override).resolve() if asset_override else _default_asset_root()
+    levels = Path(level_override).resolve() if level_override else _default_level_root()
+    if check_exists:
+        for path in (assets, levels):
+            if not path.exists():
+                raise FileNotFoundError(f"UI directory does not exist: {path}")
+    return UIDirectories(assets=assets, levels=levels)
+
+
+def resolve_directories(check_exists: bool = True) -> UIDirectories:
+    """Resolve asset/level directories, honouring environment overrides."""
+    return _resolve_cached(
+        os.environ.get(ASSET_ENV_VAR), os.environ.get(LEVEL_ENV_VAR), check_exists
+    )
+
+
+def bootstrap_directories() -> UIDirectories:
+    """Resolve the UI directories, creating any that are missing."""
+    directories = resolve_directories(check_exists=False)
+    directories.assets.mkdir(parents=True, exist_ok=True)
+    directories.levels.mkdir(parents=True, exist_ok=True)
+    return directories
+
+
+def run(level_name: str = "intro", cell_size: int = 24) -> int:
+    from ..game import LaserGame, LevelLoader
+    from .toolkit import LaserGameUI
+
+    directories = resolve_directories()
+    loader = LevelLoader(directories.levels)
+    game = LaserGame(loader.load(level_name))
+    ui = LaserGameUI(game, cell_size=cell_size, level_loader=loader)
+    ui.run()
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Play the laser game.")
+    parser.add_argument("level", nargs="?", default="intro", help="level name (without .json)")
+    parser.add_argument("--cell-size", type=int, default=24)
+    args = parser.parse_args(argv)
+    return run(args.level, cell_size=args.cell_size)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,490 @@
+"""Interactive pygame front-end for the laser game."""
+
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+from ..game import Direction, LaserGame, LevelLoader, PulseSegment
+from .assets import load_svg_assets
+from .layout import DEFAULT_CELL_SIZE, HUD_HEIGHT, compute_geometry, screen_size_for
+
+BACKGROUND_COLOR = (18, 22, 30)
+GRID_COLOR = (45, 52, 66)
+BEAM_COLOR = (255, 90, 60)
+MIRROR_COLOR = (160, 200, 255)
+EMITTER_COLOR = (239, 191, 66)
+TARGET_COLOR = (90, 200, 120)
+TEXT_COLOR = (220, 220, 220)
+
+# Name lookup table (canonical and lowercase spellings) so dict-shaped
+# segments resolve their direction without Direction.from_name's
+# normalisation and exception plumbing.
+_DIRECTION_BY_NAME = {
+    name: direction
+    for direction in Direction
+    for name in (direction.name, direction.name.lower())
+}
+
+
+def _dir_stamp(root_str: str) -> int:
+    try:
+        return os.stat(root_str).st_mtime_ns
+    except OSError:
+        return 0
+
+
+@lru_cache(maxsize=8)
+def _level_names(root_str: str, mtime_ns: int) -> Tuple[str, ...]:
+    """The sorted level names under ``root_str``, scanned once per state.
+
+    One ``os.scandir`` pass with string slicing instead of per-entry Path
+    objects; ``mtime_ns`` is part of the key so adding or removing a level
+    file falls through to a fresh scan, mirroring the asset master cache.
+    Parsed levels themselves are already cached inside LevelLoader.
+    """
+    try:
+        with os.scandir(root_str) as entries:
+            names = [entry.name[:-5] for entry in entries if entry.name.endswith(".json")]
+    except OSError:
+        return ()
+    names.sort()
+    return tuple(names)
+
+
+@dataclass(slots=True)
+class Playthrough:
+    """Slotted view over the playthrough payload for the refresh helpers.
+
+    Attribute loads replace the repeated ``dict.get`` probes the render
+    refresh used to make against the raw payload.
+    """
+
+    path: List[object] = field(default_factory=list)
+    metadata: Dict[str, object] = field(default_factory=dict)
+
+
+class LaserGameUI:
+    """Renders a :class:`LaserGame` and handles mirror-placement input."""
+
+    def __init__(
+        self,
+        game: LaserGame,
+        cell_size: int = DEFAULT_CELL_SIZE,
+        surface=None,
+        level_loader: Optional[LevelLoader] = None,
+        assets=None,
+    ):
+        self.game = game
+        self.level = game.level
+        self.cell_size = cell_size
+        if level_loader is None:
+            level_loader = LevelLoader(Path(__file__).resolve().parents[1] / "levels")
+        self.level_loader = level_loader
+        level_root = str(self.level_loader.root)
+        self.level_names = list(_level_names(level_root, _dir_stamp(level_root)))
+        if self.level.name in self.level_names:
+            self.level_index = self.level_names.index(self.level.name)
+        else:
+            self.level_index = 0
+        # A preloaded AssetLibrary (e.g. a session-scoped one in tests)
+        # skips the per-construction rasterise pass entirely.
+        self.assets = assets if assets is not None else load_svg_assets(size=cell_size)
+        self.geometry = None
+        self._compute_geometry()
+        self.screen = surface
+        self._owns_display = False
+        if self.screen is None:
+            pygame.init()
+            self.screen = pygame.display.set_mode(screen_size_for(self.geometry), pygame.DOUBLEBUF)
+            pygame.display.set_caption("Laser Game")
+            self._owns_display = True
+            # Filter the queue down to the events handle_event dispatches
+            # on, so mouse motion and window chatter never allocate event
+            # objects.  Only when we own the display — an embedder's queue
+            # is not ours to restrict.
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed(
+                [pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.VIDEORESIZE]
+            )
+        pygame.font.init()
+        self.font = pygame.font.SysFont("monospace", 14)
+        self.playthrough: Dict[str, object] = {}
+        self._pt = Playthrough()
+        self._beam_runs = []
+        self._emitter_blits = []
+        self._mirror_lines = []
+        self._metadata_surface = None
+        self._metadata_values = None
+        self._scene_bg = None
+        self._needs_update = True
+        # Geometry itself was computed above, but the per-level caches that
+        # hang off it (emitter blit positions) still need their first build.
+        self._geometry_dirty = True
+        self._dirty = True
+        self.running = False
+
+    # -- state --------------------------------------------------------------
+
+    def _compute_geometry(self) -> None:
+        self.geometry = compute_geometry(self.level.width, self.level.height, self.cell_size)
+        # The grid and target outlines only change with the geometry, so the
+        # pre-rendered background is stale from here until the next draw; the
+        # displayed frame outside the board rect is stale too, so the next
+        # present must push the whole window.
+        self._static_bg = None
+        self._full_frame_pending = True
+        origin_x, origin_y = self.geometry.origin
+        width_px, height_px = self.geometry.pixel_size
+        self._grid_rect = pygame.Rect(origin_x, origin_y, width_px, height_px)
+        cell_size = self.geometry.cell_size
+        sprite = pygame.Surface((cell_size, cell_size), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, EMITTER_COLOR, (cell_size // 2, cell_size // 2), cell_size // 3)
+        self._emitter_sprite = sprite
+
+    def load_level(self, name: str) -> None:
+        level = self.level_loader.load(name)
+        self.game = LaserGame(level)
+        self.level = level
+        self._needs_update = True
+        self._geometry_dirty = True
+        self._dirty = True
+
+    def cycle_level(self, step: int = 1) -> None:
+        if not self.level_names:
+            return
+        self.level_index = (self.level_index + step) % len(self.level_names)
+        self.load_level(self.level_names[self.level_index])
+
+    def update_playthrough(self) -> None:
+        if not self._needs_update:
+            return
+        # Mirror edits leave the board shape alone; only level loads (and a
+        # future window resize) need the geometry and its derived caches
+        # rebuilt before the playthrough refresh.
+        if self._geometry_dirty:
+            self._compute_geometry()
+            # Emitters never move within a level, so their blit positions
+            # only need rebuilding alongside the geometry.
+            self._refresh_emitter_blits()
+            self._geometry_dirty = False
+        self.game.propagate()
+        self.playthrough = self.game.playthrough()
+        self._pt = Playthrough(
+            path=self.playthrough.get("path", []),
+            metadata=self.playthrough.get("metadata", {}),
+        )
+        self._refresh_beam_runs()
+        self._refresh_mirror_lines()
+        self._refresh_metadata_surface()
+        self._scene_bg = None
+        self._needs_update = False
+
+    def _refresh_emitter_blits(self) -> None:
+        sprite = self._emitter_sprite
+        cell_to_topleft = self.geometry.cell_to_topleft
+        self._emitter_blits = [
+            (sprite, cell_to_topleft(emitter.position)) for emitter in self.level.emitters
+        ]
+
+    def _refresh_mirror_lines(self) -> None:
+        # Mirrors only mutate through placements, which always route through
+        # a playthrough refresh; resolving the orientation branch and the
+        # pixel transforms here leaves the frame loop a list of endpoints.
+        geometry = self.geometry
+        origin_x, origin_y = geometry.origin
+        cell_size = geometry.cell_size
+        lines = []
+        append = lines.append
+        for (cell_x, cell_y), mirror in self.level.mirrors.items():
+            x = origin_x + cell_x * cell_size
+            y = origin_y + cell_y * cell_size
+            if mirror.orientation == "/":
+                append(((x, y + cell_size), (x + cell_size, y)))
+            else:
+                append(((x, y), (x + cell_size, y + cell_size)))
+        self._mirror_lines = lines
+
+    def _refresh_beam_runs(self) -> None:
+        # The beam path only changes when the playthrough does, so the
+        # coercion and cell-to-pixel transforms run once per update here and
+        # every frame in between consumes plain endpoint tuples.  The
+        # transform is inlined over local scalars — long traces make this
+        # the tightest numeric loop in the UI.
+        geometry = self.geometry
+        origin_x, origin_y = geometry.origin
+        cell_size = geometry.cell_size
+        center_x = origin_x + cell_size // 2
+        center_y = origin_y + cell_size // 2
+        runs = []
+        current = None
+        last_end = None
+        for segment in map(self._coerce_segment, self._pt.path):
+            if segment is None:
+                continue
+            start_x, start_y = segment.start
+            end_x, end_y = segment.end
+            start = (center_x + start_x * cell_size, center_y + start_y * cell_size)
+            end = (center_x + end_x * cell_size, center_y + end_y * cell_size)
+            # Consecutive segments of one walk share endpoints, so most of a
+            # trace collapses into contiguous polyline runs that draw with a
+            # single batched call each; splits and new emitters start fresh.
+            if start == last_end:
+                current.append(end)
+            else:
+                current = [start, end]
+                runs.append(current)
+            last_end = end
+        self._beam_runs = runs
+
+    # -- input --------------------------------------------------------------
+
+    def _position_from_mouse(self, position):
+        grid_rect = self._grid_rect
+        if not grid_rect.collidepoint(position):
+            return None
+        cell_size = self.cell_size
+        return ((position[0] - grid_rect.x) // cell_size, (position[1] - grid_rect.y) // cell_size)
+
+    def _place_or_toggle_mirror(self, cell) -> None:
+        mirror = self.level.mirrors.get(cell)
+        if mirror is None:
+            orientation = "/"
+        else:
+            orientation = "\\" if mirror.orientation == "/" else "/"
+        self.game.queue_placement({"type": "mirror", "position": list(cell), "orientation": orientation})
+        self._needs_update = True
+        self._dirty = True
+
+    def _remove_mirror(self, cell) -> None:
+        if cell not in self.level.mirrors:
+            return
+        self.game.queue_placement({"type": "remove_mirror", "position": list(cell)})
+        self._needs_update = True
+        self._dirty = True
+
+    def handle_event(self, event) -> None:
+        if event.type == pygame.QUIT:
+            self.running = False
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.running = False
+            elif event.key == pygame.K_n:
+                self.cycle_level(1)
+            elif event.key == pygame.K_p:
+                self.cycle_level(-1)
+        elif event.type == pygame.VIDEORESIZE:
+            # Window changes invalidate the geometry-derived caches the
+            # same way a level load does.
+            self._needs_update = True
+            self._geometry_dirty = True
+            self._dirty = True
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            cell = self._position_from_mouse(event.pos)
+            if cell is None:
+                return
+            if event.button == 1:
+                self._place_or_toggle_mirror(cell)
+            elif event.button == 3:
+                self._remove_mirror(cell)
+
+    # -- rendering ----------------------------------------------------------
+
+    @staticmethod
+    def _coerce_segment(data):
+        # Nearly every call receives a PulseSegment; an exact type check is
+        # the cheapest dispatch and PulseSegment is never subclassed.
+        if type(data) is PulseSegment:
+            return data
+        if isinstance(data, dict):
+            name = data.get("direction", "EAST")
+            direction = _DIRECTION_BY_NAME.get(name)
+            if direction is None:
+                # Non-canonical spellings (e.g. lowercase) still resolve
+                # through the normalising constructor.
+                try:
+                    direction = Direction.from_name(name)
+                except ValueError:
+                    return None
+            start = data.get("start")
+            end = data.get("end")
+            if start is None or end is None:
+                return None
+            return PulseSegment(
+                start=tuple(start),
+                end=tuple(end),
+                direction=direction,
+                energy=int(data.get("energy", 0)),
+                intensity=float(data.get("intensity", 1.0)),
+                tick=int(data.get("tick", 0)),
+            )
+        if isinstance(data, (tuple, list)) and len(data) >= 2:
+            return PulseSegment(
+                start=tuple(data[0]),
+                end=tuple(data[1]),
+                direction=Direction.EAST,
+                energy=0,
+                intensity=1.0,
+                tick=0,
+            )
+        return None
+
+    def _draw_grid(self, surface) -> None:
+        # Runs once per geometry change (into the static background), not
+        # per frame; the hoisted locals just keep the rebuild itself tight.
+        geometry = self.geometry
+        origin_x, origin_y = geometry.origin
+        width_px, height_px = geometry.pixel_size
+        cell_size = geometry.cell_size
+        draw_line = pygame.draw.line
+        bottom = origin_y + height_px
+        right = origin_x + width_px
+        for x in range(origin_x, right + 1, cell_size):
+            draw_line(surface, GRID_COLOR, (x, origin_y), (x, bottom))
+        for y in range(origin_y, bottom + 1, cell_size):
+            draw_line(surface, GRID_COLOR, (origin_x, y), (right, y))
+
+    def _draw_emitters(self, surface) -> None:
+        # One batched FASTCALL blit of a pre-rendered sprite instead of a
+        # circle rasterisation per emitter; targets already live in the
+        # static background.
+        batch = getattr(surface, "fblits", None) or surface.blits
+        batch(self._emitter_blits)
+
+    def _draw_targets(self, surface) -> None:
+        for position in self.level.targets:
+            topleft = self.geometry.cell_to_topleft(position)
+            rect = pygame.Rect(topleft[0], topleft[1], self.geometry.cell_size, self.geometry.cell_size)
+            pygame.draw.rect(surface, TARGET_COLOR, rect, 2)
+
+    def _build_static_bg(self):
+        # Everything that is constant between placements — the backdrop
+        # fill, the grid lines, and the target outlines — rendered once per
+        # level/geometry into a single surface so each frame starts from one
+        # blit instead of O(width + height) draw calls.
+        surface = pygame.Surface(self.screen.get_size())
+        surface.fill(BACKGROUND_COLOR)
+        self._draw_grid(surface)
+        self._draw_targets(surface)
+        if self._owns_display:
+            # Matching the display's pixel format turns the per-frame blit
+            # into a straight copy with no conversion pass.  convert()
+            # needs an initialised display, so headless surfaces skip it.
+            surface = surface.convert()
+        return surface
+
+    def _build_scene_bg(self):
+        # The full static scene — background plus emitters and mirrors —
+        # composited once per playthrough refresh.  Embedders that call
+        # draw() every frame then pay one blit for everything except the
+        # beams and HUD.
+        if self._static_bg is None:
+            self._static_bg = self._build_static_bg()
+        scene = self._static_bg.copy()
+        self._draw_emitters(scene)
+        self._draw_mirrors(scene)
+        return scene
+
+    def _draw_mirrors(self, surface) -> None:
+        # pygame.draw.lines only batches *connected* polylines, which would
+        # join unrelated mirrors with spurious strokes, so each mirror stays
+        # one C call over the endpoints cached at refresh time.
+        draw_line = pygame.draw.line
+        for start, end in self._mirror_lines:
+            draw_line(surface, MIRROR_COLOR, start, end, 3)
+
+    def _draw_beam_path(self) -> None:
+        draw_lines = pygame.draw.lines
+        screen = self.screen
+        for run in self._beam_runs:
+            draw_lines(screen, BEAM_COLOR, False, run, 4)
+
+    _METADATA_KEYS = ("name", "ticks", "complete", "loop_detected")
+
+    def _refresh_metadata_surface(self) -> None:
+        # Font.render rasterises glyphs and allocates a surface per call;
+        # doing that per line per frame is the priciest part of the HUD.
+        # Render the block once per playthrough refresh instead, skipping
+        # even that when the values are unchanged.
+        metadata = self._pt.metadata
+        values = tuple(metadata.get(key, "?") for key in self._METADATA_KEYS)
+        if values == self._metadata_values and self._metadata_surface is not None:
+            return
+        lines = [
+            self.font.render(f"{key}: {value}", True, TEXT_COLOR)
+            for key, value in zip(self._METADATA_KEYS, values)
+        ]
+        width = max(line.get_width() for line in lines)
+        height = sum(line.get_height() + 2 for line in lines)
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        y = 0
+        for line in lines:
+            surface.blit(line, (0, y))
+            y += line.get_height() + 2
+        if self._owns_display:
+            # Align with the display format so the HUD blit skips per-pixel
+            # conversion; headless surfaces can't convert without a display.
+            surface = surface.convert_alpha()
+        self._metadata_surface = surface
+        self._metadata_values = values
+
+    def _draw_metadata(self) -> None:
+        if self._metadata_surface is None:
+            self._refresh_metadata_surface()
+        origin_x, origin_y = self.geometry.origin
+        self.screen.blit(self._metadata_surface, (origin_x, origin_y + self.geometry.pixel_size[1] + 16))
+
+    def draw(self) -> None:
+        if self._scene_bg is None:
+            self._scene_bg = self._build_scene_bg()
+        self.screen.blit(self._scene_bg, (0, 0))
+        self._draw_beam_path()
+        self._draw_metadata()
+        if self._owns_display:
+            if self._full_frame_pending:
+                pygame.display.flip()
+                self._full_frame_pending = False
+            else:
+                # Everything dynamic lands inside the board or the HUD
+                # block below it; pushing those two rects keeps present
+                # traffic proportional to the level, not the window.
+                pygame.display.update(self._dynamic_rects())
+
+    def _dynamic_rects(self):
+        origin_x, origin_y = self.geometry.origin
+        _, height_px = self.geometry.pixel_size
+        hud = pygame.Rect(
+            origin_x,
+            origin_y + height_px,
+            self.screen.get_width() - origin_x,
+            HUD_HEIGHT,
+        )
+        return [self._grid_rect, hud]
+
+    # -- main loop ----------------------------------------------------------
+
+    def run(self) -> None:
+        self.running = True
+        while self.running:
+            # Block for input instead of polling at 60 Hz: a short timeout
+            # keeps the frame cap while work is pending, a long one lets the
+            # process sleep between clicks rather than waking every 16 ms.
+            timeout = 16 if (self._dirty or self._needs_update) else 250
+            event = pygame.event.wait(timeout)
+            if event.type != pygame.NOEVENT:
+                self.handle_event(event)
+                for queued in pygame.event.get():
+                    self.handle_event(queued)
+            self.update_playthrough()
+            if self._dirty:
+                self.draw()
+                self._dirty = False
+        if self._owns_display:
+            pygame.quit()
+
+
+# Historical alias kept for external callers.
+LaserGameApp = LaserGameUI
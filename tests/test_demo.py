@@ -0,0 +1,15 @@
+from laser_game import demo
+
+
+def test_demo_prints_summary(capsys):
+    assert demo.main(["intro"]) == 0
+    out = capsys.readouterr().out
+    assert "Level: intro" in out
+    assert "Target energy deliveries:" in out
+    assert "(8, 3)" in out
+
+
+def test_demo_without_solution(capsys):
+    assert demo.main(["reflection", "--no-solution"]) == 0
+    out = capsys.readouterr().out
+    assert "Complete: False" in out
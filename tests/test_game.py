@@ -0,0 +1,275 @@
+import pytest
+
+from laser_game.game import (
+    Direction,
+    EmitterRuntime,
+    LaserEmitter,
+    LaserGame,
+    Level,
+    Mirror,
+    Prism,
+    Target,
+    apply_placement_to_level,
+    clamp_energy,
+    MAX_ENERGY_LEVEL,
+)
+
+
+def make_level(**overrides):
+    defaults = dict(name="test", width=6, height=6, energy_goal=1, max_ticks=64)
+    defaults.update(overrides)
+    return Level(**defaults)
+
+
+class TestDirection:
+    def test_turn_left_cycles(self):
+        direction = Direction.NORTH
+        for _ in range(4):
+            direction = direction.turn_left()
+        assert direction is Direction.NORTH
+
+    def test_turn_right_is_inverse_of_turn_left(self):
+        for direction in Direction:
+            assert direction.turn_left().turn_right() is direction
+
+    def test_reverse(self):
+        assert Direction.NORTH.reverse() is Direction.SOUTH
+        assert Direction.EAST.reverse() is Direction.WEST
+
+    def test_from_name_rejects_unknown(self):
+        with pytest.raises(ValueError):
+            Direction.from_name("UPWARDS")
+
+
+class TestMirror:
+    @pytest.mark.parametrize(
+        "orientation, incoming, outgoing",
+        [
+            ("/", Direction.EAST, Direction.NORTH),
+            ("/", Direction.SOUTH, Direction.WEST),
+            ("\\", Direction.EAST, Direction.SOUTH),
+            ("\\", Direction.NORTH, Direction.WEST),
+        ],
+    )
+    def test_reflect(self, orientation, incoming, outgoing):
+        assert Mirror(orientation=orientation).reflect(incoming) is outgoing
+
+    def test_reflect_is_involution(self):
+        for orientation in ("/", "\\"):
+            mirror = Mirror(orientation=orientation)
+            for direction in Direction:
+                assert mirror.reflect(mirror.reflect(direction)) is direction
+
+    def test_invalid_orientation_rejected(self):
+        with pytest.raises(ValueError):
+            Mirror(orientation="|")
+
+
+def test_clamp_energy_bounds():
+    assert clamp_energy(-3) == 0
+    assert clamp_energy(5) == 5
+    assert clamp_energy(MAX_ENERGY_LEVEL + 10) == MAX_ENERGY_LEVEL
+    assert clamp_energy("not a number") == 0
+    assert clamp_energy(None) == 0
+
+
+def test_prism_split_counts():
+    assert len(Prism(spread=3).split(Direction.EAST)) == 3
+    assert len(Prism(spread=2).split(Direction.EAST)) == 2
+    assert Prism(spread=1).split(Direction.EAST) == (Direction.EAST,)
+
+
+def test_splitter_outputs_patterns():
+    outputs = LaserGame._splitter_outputs("dual", Direction.EAST)
+    assert list(outputs) == [Direction.NORTH, Direction.SOUTH]
+    assert len(LaserGame._splitter_outputs("triple", Direction.EAST)) == 3
+    assert len(LaserGame._splitter_outputs("cross", Direction.EAST)) == 4
+    assert list(LaserGame._splitter_outputs("unknown", Direction.EAST)) == [Direction.EAST]
+
+
+def test_split_energy_conserves_total():
+    shares = LaserGame._split_energy(10, 3)
+    assert sum(shares) == 10
+    assert max(shares) - min(shares) <= 1
+
+
+def test_propagate_delivers_energy_to_target():
+    level = make_level(
+        emitters=[LaserEmitter(position=(0, 2), direction=Direction.EAST, energy=6)],
+        mirrors={(4, 2): Mirror(orientation="/")},
+        targets={(4, 0): Target(required_energy=1)},
+    )
+    game = LaserGame(level)
+    game.propagate()
+    assert game.target_energy[(4, 0)] >= 1
+    assert game.level_complete()
+
+
+def test_trace_target_absorbs_full_energy():
+    level = make_level(
+        emitters=[LaserEmitter(position=(0, 2), direction=Direction.EAST, energy=6)],
+        targets={(5, 2): Target(required_energy=1)},
+    )
+    game = LaserGame(level)
+    energies = game.trace()
+    assert energies[(5, 2)] == 6
+
+
+def test_step_ray_marches_across_empty_runs():
+    level = make_level(
+        width=20,
+        height=3,
+        emitters=[LaserEmitter(position=(0, 1), direction=Direction.EAST, energy=6)],
+        targets={(18, 1): Target(required_energy=1)},
+    )
+    game = LaserGame(level)
+    game.propagate()
+    assert game.target_energy[(18, 1)] >= 1
+    # The empty corridor collapses into one spanning segment, not 18 cells.
+    spans = [segment for segment in game.path if segment.start == (0, 1)]
+    assert spans and spans[0].end == (18, 1)
+
+
+def test_history_limit_bounds_retained_frames():
+    level = make_level(
+        emitters=[
+            LaserEmitter(position=(0, 2), direction=Direction.EAST, energy=4, emission_interval=1)
+        ],
+        mirrors={(4, 2): Mirror(orientation="/"), (4, 0): Mirror(orientation="\\")},
+    )
+    game = LaserGame(level, max_ticks=32, history_limit=3)
+    game.propagate()
+    assert len(game.timeline) <= 3
+    assert len(game.path) <= 3
+
+
+def test_loop_detection_in_mirror_box():
+    level = make_level(
+        emitters=[LaserEmitter(position=(2, 0), direction=Direction.EAST, energy=8)],
+        mirrors={
+            (4, 0): Mirror(orientation="\\"),
+            (4, 4): Mirror(orientation="/"),
+            (1, 4): Mirror(orientation="\\"),
+            (1, 0): Mirror(orientation="/"),
+        },
+    )
+    game = LaserGame(level)
+    game.propagate()
+    assert game.state.loop_detected
+
+
+def test_bomb_chain_destroys_obstacles():
+    from laser_game.game import Bomb, Obstacle
+
+    level = make_level(
+        width=10,
+        height=5,
+        emitters=[LaserEmitter(position=(0, 2), direction=Direction.EAST, energy=10)],
+        bombs={(4, 2): Bomb(power=2), (6, 2): Bomb(power=2)},
+        obstacles={(4, 1): Obstacle(), (6, 3): Obstacle(), (8, 2): Obstacle()},
+    )
+    game = LaserGame(level)
+    game.propagate()
+    assert not game.active_bombs
+    assert set(game.destroyed_obstacles) == {(4, 1), (6, 3), (8, 2)}
+
+
+def test_queue_placement_applied_during_propagate():
+    level = make_level(
+        emitters=[LaserEmitter(position=(0, 2), direction=Direction.EAST, energy=6)],
+        targets={(4, 0): Target(required_energy=1)},
+    )
+    game = LaserGame(level)
+    game.queue_placement({"type": "mirror", "position": [4, 2], "orientation": "/"})
+    game.propagate()
+    assert (4, 2) in level.mirrors
+    assert game.target_energy[(4, 0)] >= 1
+
+
+def test_level_is_slotted_and_frozen():
+    import dataclasses
+
+    level = make_level()
+    assert not hasattr(level, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        level.width = 99
+    # Container contents stay mutable for placements.
+    level.mirrors[(0, 0)] = Mirror()
+    assert (0, 0) in level.mirrors
+
+
+def test_apply_placement_rejects_unknown_type():
+    level = make_level()
+    with pytest.raises(ValueError):
+        apply_placement_to_level(level, {"type": "teleporter", "position": [0, 0]})
+
+
+def test_emitter_runtime_single_shot():
+    runtime = EmitterRuntime(
+        emitter=LaserEmitter(position=(0, 0), direction=Direction.EAST, energy=4), index=0
+    )
+    assert runtime.has_future_activity(0)
+    heads = runtime.generate_heads(0)
+    assert len(heads) == 1
+    assert heads[0].energy == 4
+    assert runtime.generate_heads(1) == []
+    assert not runtime.has_future_activity(1)
+
+
+def test_emitter_runtime_periodic():
+    runtime = EmitterRuntime(
+        emitter=LaserEmitter(
+            position=(0, 0), direction=Direction.EAST, energy=4, emission_interval=3
+        ),
+        index=0,
+    )
+    fired = [tick for tick in range(7) if runtime.generate_heads(tick)]
+    assert fired == [0, 3, 6]
+
+
+def test_propagate_many_matches_serial_runs():
+    from pathlib import Path
+
+    from laser_game.game import propagate_many
+
+    level_path = Path(__file__).resolve().parents[1] / "laser_game" / "levels" / "reflection.json"
+    batches = [
+        [],
+        [{"type": "mirror", "position": [4, 5], "orientation": "/"}],
+    ]
+    serial = propagate_many(level_path, batches, n_jobs=1)
+    parallel = propagate_many(level_path, batches, n_jobs=2)
+    assert serial == parallel
+    assert serial[0]["complete"] is False
+    assert serial[1]["complete"] is True
+
+
+def test_playthrough_payload_shape():
+    level = make_level(
+        emitters=[LaserEmitter(position=(0, 2), direction=Direction.EAST, energy=6)],
+        targets={(5, 2): Target(required_energy=1)},
+    )
+    game = LaserGame(level)
+    game.propagate()
+    payload = game.playthrough()
+    assert payload["metadata"]["name"] == "test"
+    assert payload["targets"][(5, 2)] >= 1
+    assert payload["path"], "expected at least one beam segment"
+    segment = payload["path"][0]
+    assert set(segment) == {"start", "end", "direction", "energy", "intensity", "tick"}
+    assert isinstance(segment["direction"], str)
+
+
+def test_playthrough_summary_matches_full_payload():
+    level = make_level(
+        emitters=[LaserEmitter(position=(0, 2), direction=Direction.EAST, energy=6)],
+        targets={(5, 2): Target(required_energy=1)},
+    )
+    game = LaserGame(level)
+    game.propagate()
+    summary = game.playthrough_summary()
+    payload = game.playthrough()
+    assert summary["segment_count"] == len(payload["path"])
+    assert summary["targets"] == payload["targets"]
+    assert summary["metadata"] == payload["metadata"]
+    assert list(game.iter_segments()) == payload["path"]
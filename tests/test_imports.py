@@ -0,0 +1,37 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_importing_package_does_not_pull_in_ui():
+    # Run in a fresh interpreter so previously imported modules don't mask a
+    # regression to an eager 'from .ui import LaserGameUI'.
+    code = (
+        "import sys, laser_game; "
+        "assert 'laser_game.ui' not in sys.modules, 'ui imported eagerly'; "
+        "assert 'pygame' not in sys.modules, 'pygame imported eagerly'"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=ROOT)
+
+
+def test_lazy_attribute_resolves_and_is_cached():
+    import laser_game
+
+    ui_class = laser_game.LaserGameUI
+    assert ui_class is laser_game.LaserGameUI
+    assert "LaserGameUI" in dir(laser_game)
+
+
+def test_package_has_single_init_definition():
+    # Guards against the historical duplicated-__init__ packaging mistake.
+    inits = list((ROOT / "laser_game").glob("__init__*.py"))
+    assert inits == [ROOT / "laser_game" / "__init__.py"]
+
+
+def test_ui_package_has_single_init_definition():
+    # The ui package suffered the same duplicated re-export blocks once;
+    # keep its import surface to the one canonical module.
+    inits = list((ROOT / "laser_game" / "ui").glob("__init__*.py"))
+    assert inits == [ROOT / "laser_game" / "ui" / "__init__.py"]
@@ -0,0 +1,108 @@
+from pathlib import Path
+
+import pytest
+
+from laser_game.game import Level, LevelLoader, SolutionValidator
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[1] / "laser_game"
+LEVEL_NAMES = sorted(path.stem for path in (PACKAGE_ROOT / "levels").glob("*.json"))
+SOLUTION_NAMES = sorted(path.stem for path in (PACKAGE_ROOT / "solutions").glob("*.json"))
+
+
+@pytest.fixture
+def loader():
+    return LevelLoader(PACKAGE_ROOT / "levels")
+
+
+@pytest.fixture
+def validator():
+    return SolutionValidator(PACKAGE_ROOT / "solutions")
+
+
+@pytest.mark.parametrize("name", LEVEL_NAMES)
+def test_level_loader_loads_all_levels(loader, name):
+    level = loader.load(name)
+    assert isinstance(level, Level)
+    assert level.name == name
+    assert level.width > 0 and level.height > 0
+    assert level.emitters, "every shipped level needs at least one emitter"
+
+
+@pytest.mark.parametrize("name", SOLUTION_NAMES)
+def test_solution_validator_detects_expected_targets(loader, validator, name):
+    level = loader.load(name)
+    solution = validator.load_solution(name)
+    report = validator.validate(level, solution)
+    assert report.valid, f"mismatches: {report.mismatches}"
+
+
+def test_apply_solution_short_circuits_empty_solution(loader, validator):
+    level = loader.load("intro")
+    solution = validator.load_solution("intro")
+    assert not solution.placements
+    assert validator.apply_solution(level, solution) is level
+
+
+def test_apply_solution_skips_reapplication(loader, validator):
+    level = loader.load("reflection")
+    solution = validator.load_solution("reflection")
+    solved = validator.apply_solution(level, solution)
+    assert solved is not level
+    assert validator.apply_solution(solved, solution) is solved
+
+
+def test_apply_solution_does_not_mutate_original(loader, validator):
+    level = loader.load("reflection")
+    solution = validator.load_solution("reflection")
+    solved = validator.apply_solution(level, solution)
+    assert (4, 5) in solved.mirrors
+    assert (4, 5) not in level.mirrors
+
+
+def test_every_level_has_a_solution_file():
+    assert LEVEL_NAMES == SOLUTION_NAMES
+
+
+def test_level_loader_caches_by_path_and_mtime(tmp_path, monkeypatch):
+    import laser_game.game as game_module
+
+    source = (PACKAGE_ROOT / "levels" / "intro.json").read_text()
+    (tmp_path / "copy.json").write_text(source)
+    loader = LevelLoader(tmp_path)
+
+    calls = []
+    real_loads = game_module._json_loads
+
+    def counting_loads(raw):
+        calls.append(raw)
+        return real_loads(raw)
+
+    monkeypatch.setattr(game_module, "_json_loads", counting_loads)
+    first = loader.load("copy")
+    second = loader.load("copy")
+    assert len(calls) == 1
+    assert first is not second
+    assert first == second
+
+
+def test_level_loader_cache_invalidated_on_change(tmp_path):
+    import os
+
+    path = tmp_path / "mutable.json"
+    source = (PACKAGE_ROOT / "levels" / "intro.json").read_text()
+    path.write_text(source)
+    loader = LevelLoader(tmp_path)
+    assert loader.load("mutable").energy_goal == 1
+
+    path.write_text(source.replace('"energy_goal": 1', '"energy_goal": 5'))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert loader.load("mutable").energy_goal == 5
+
+
+def test_loaded_levels_are_independent_copies(loader):
+    from laser_game.game import Mirror
+
+    first = loader.load("intro")
+    first.mirrors[(1, 1)] = Mirror()
+    assert (1, 1) not in loader.load("intro").mirrors
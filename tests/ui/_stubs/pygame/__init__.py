@@ -0,0 +1,435 @@
+"""A minimal, deterministic pure-Python pygame stand-in for headless tests.
+
+Only the slice of the pygame API that the laser game UI touches is
+implemented.  Rendering is done into plain RGBA bytearrays so snapshot
+digests are stable across machines and SDL versions.
+"""
+
+SRCALPHA = 0x00010000
+DOUBLEBUF = 0x40000000
+SCALED = 0x00000200
+
+NOEVENT = 0
+QUIT = 256
+KEYDOWN = 768
+MOUSEMOTION = 1024
+MOUSEBUTTONDOWN = 1025
+VIDEORESIZE = 32769
+
+K_ESCAPE = 27
+K_n = ord("n")
+K_p = ord("p")
+
+_initialised = False
+
+
+def init():
+    global _initialised
+    _initialised = True
+
+
+def quit():  # noqa: A001 - mirrors the pygame API
+    global _initialised
+    _initialised = False
+
+
+def get_init():
+    return _initialised
+
+
+def _normalise_color(color):
+    if len(color) == 3:
+        return (int(color[0]), int(color[1]), int(color[2]), 255)
+    return (int(color[0]), int(color[1]), int(color[2]), int(color[3]))
+
+
+class Rect:
+    def __init__(self, x, y=None, w=None, h=None):
+        if y is None:
+            (x, y), (w, h) = x  # Rect(((x, y), (w, h)))
+        self.x = int(x)
+        self.y = int(y)
+        self.w = int(w)
+        self.h = int(h)
+
+    @property
+    def width(self):
+        return self.w
+
+    @property
+    def height(self):
+        return self.h
+
+    def collidepoint(self, *args):
+        if len(args) == 1:
+            x, y = args[0]
+        else:
+            x, y = args
+        return self.x <= x < self.x + self.w and self.y <= y < self.y + self.h
+
+
+class Surface:
+    def __init__(self, size, flags=0):
+        self._w = int(size[0])
+        self._h = int(size[1])
+        self._flags = flags
+        self._pixels = bytearray(self._w * self._h * 4)
+        if not flags & SRCALPHA:
+            # Opaque surfaces start fully opaque black, like SDL.
+            for index in range(3, len(self._pixels), 4):
+                self._pixels[index] = 255
+
+    # -- geometry ------------------------------------------------------
+
+    def get_size(self):
+        return (self._w, self._h)
+
+    def get_width(self):
+        return self._w
+
+    def get_height(self):
+        return self._h
+
+    def get_rect(self):
+        return Rect(0, 0, self._w, self._h)
+
+    # -- pixels --------------------------------------------------------
+
+    def fill(self, color, rect=None):
+        r, g, b, a = _normalise_color(color)
+        if rect is None:
+            x0, y0, x1, y1 = 0, 0, self._w, self._h
+        else:
+            if not isinstance(rect, Rect):
+                rect = Rect(rect[0], rect[1], rect[2], rect[3])
+            x0 = max(0, rect.x)
+            y0 = max(0, rect.y)
+            x1 = min(self._w, rect.x + rect.w)
+            y1 = min(self._h, rect.y + rect.h)
+        row = bytes((r, g, b, a)) * max(0, x1 - x0)
+        for y in range(y0, y1):
+            start = (y * self._w + x0) * 4
+            self._pixels[start : start + len(row)] = row
+
+    def set_at(self, position, color):
+        x, y = int(position[0]), int(position[1])
+        if 0 <= x < self._w and 0 <= y < self._h:
+            index = (y * self._w + x) * 4
+            self._pixels[index : index + 4] = bytes(_normalise_color(color))
+
+    def get_at(self, position):
+        x, y = int(position[0]), int(position[1])
+        index = (y * self._w + x) * 4
+        return tuple(self._pixels[index : index + 4])
+
+    def blit(self, source, dest):
+        if isinstance(dest, Rect):
+            dx, dy = dest.x, dest.y
+        else:
+            dx, dy = int(dest[0]), int(dest[1])
+        for sy in range(source._h):
+            ty = dy + sy
+            if ty < 0 or ty >= self._h:
+                continue
+            for sx in range(source._w):
+                tx = dx + sx
+                if tx < 0 or tx >= self._w:
+                    continue
+                sindex = (sy * source._w + sx) * 4
+                if source._pixels[sindex + 3] == 0:
+                    continue
+                tindex = (ty * self._w + tx) * 4
+                self._pixels[tindex : tindex + 4] = source._pixels[sindex : sindex + 4]
+        return Rect(dx, dy, source._w, source._h)
+
+    def blits(self, sequence):
+        return [self.blit(source, dest) for source, dest in sequence]
+
+    def fblits(self, sequence):
+        for source, dest in sequence:
+            self.blit(source, dest)
+
+    def copy(self):
+        clone = Surface((self._w, self._h), self._flags)
+        clone._pixels[:] = self._pixels
+        return clone
+
+    def convert(self):
+        return self.copy()
+
+    def convert_alpha(self):
+        return self.copy()
+
+
+class _FontModule:
+    _initialised = False
+
+    def init(self):
+        _FontModule._initialised = True
+
+    def get_init(self):
+        return _FontModule._initialised
+
+    def SysFont(self, name, size, bold=False, italic=False):
+        return Font(name, size)
+
+    def Font(self, path, size):
+        return Font(str(path), size)
+
+
+class Font:
+    def __init__(self, name, size):
+        self.name = name
+        self.size = int(size)
+
+    def render(self, text, antialias, color, background=None):
+        width = max(1, 7 * len(text))
+        height = max(4, self.size)
+        surface = Surface((width, height), SRCALPHA)
+        surface.fill(_normalise_color(color))
+        # Encode the text deterministically so different strings render to
+        # different (and reproducible) pixels.
+        for index, char in enumerate(text):
+            surface.set_at((index % width, index // width), (ord(char) % 256, 0, 0, 255))
+        return surface
+
+
+font = _FontModule()
+
+
+class _DrawModule:
+    def line(self, surface, color, start, end, width=1):
+        x0, y0 = int(start[0]), int(start[1])
+        x1, y1 = int(end[0]), int(end[1])
+        dx = abs(x1 - x0)
+        dy = abs(y1 - y0)
+        sx = 1 if x0 < x1 else -1
+        sy = 1 if y0 < y1 else -1
+        err = dx - dy
+        radius = max(0, width // 2)
+        while True:
+            for ox in range(-radius, radius + 1):
+                for oy in range(-radius, radius + 1):
+                    surface.set_at((x0 + ox, y0 + oy), color)
+            if x0 == x1 and y0 == y1:
+                break
+            err2 = 2 * err
+            if err2 > -dy:
+                err -= dy
+                x0 += sx
+            if err2 < dx:
+                err += dx
+                y0 += sy
+        return Rect(min(x0, x1), min(y0, y1), dx + 1, dy + 1)
+
+    def lines(self, surface, color, closed, points, width=1):
+        for start, end in zip(points, points[1:]):
+            self.line(surface, color, start, end, width)
+        if closed and len(points) > 2:
+            self.line(surface, color, points[-1], points[0], width)
+
+    def aalines(self, surface, color, closed, points):
+        self.lines(surface, color, closed, points, 1)
+
+    def rect(self, surface, color, rect, width=0):
+        if not isinstance(rect, Rect):
+            rect = Rect(rect[0], rect[1], rect[2], rect[3])
+        if width <= 0:
+            surface.fill(color, rect)
+            return rect
+        for offset in range(width):
+            x0, y0 = rect.x + offset, rect.y + offset
+            x1 = rect.x + rect.w - 1 - offset
+            y1 = rect.y + rect.h - 1 - offset
+            self.line(surface, color, (x0, y0), (x1, y0))
+            self.line(surface, color, (x0, y1), (x1, y1))
+            self.line(surface, color, (x0, y0), (x0, y1))
+            self.line(surface, color, (x1, y0), (x1, y1))
+        return rect
+
+    def circle(self, surface, color, center, radius, width=0):
+        cx, cy = int(center[0]), int(center[1])
+        radius = int(radius)
+        rr = radius * radius
+        inner = (radius - max(1, width)) ** 2 if width > 0 else -1
+        for y in range(-radius, radius + 1):
+            for x in range(-radius, radius + 1):
+                dist = x * x + y * y
+                if dist <= rr and dist >= inner:
+                    surface.set_at((cx + x, cy + y), color)
+        return Rect(cx - radius, cy - radius, 2 * radius, 2 * radius)
+
+
+draw = _DrawModule()
+
+
+class _DisplayModule:
+    def __init__(self):
+        self._surface = None
+        self.caption = ""
+
+    def init(self):
+        pass
+
+    def set_mode(self, size, flags=0, vsync=0):
+        self._surface = Surface(size, flags)
+        return self._surface
+
+    def get_surface(self):
+        return self._surface
+
+    def set_caption(self, caption):
+        self.caption = caption
+
+    def flip(self):
+        pass
+
+    def update(self, rects=None):
+        pass
+
+
+display = _DisplayModule()
+
+
+class Event:
+    def __init__(self, type, **attributes):  # noqa: A002 - mirrors pygame
+        self.type = type
+        for key, value in attributes.items():
+            setattr(self, key, value)
+
+    def __repr__(self):
+        return f"<Event({self.type})>"
+
+
+class _EventModule:
+    Event = Event
+
+    def __init__(self):
+        self._queue = []
+        self._allowed = None
+
+    def post(self, event):
+        if self._allowed is not None and event.type not in self._allowed:
+            return False
+        self._queue.append(event)
+        return True
+
+    def get(self, eventtype=None, pump=True):
+        if eventtype is None:
+            events, self._queue = self._queue, []
+            return events
+        if isinstance(eventtype, int):
+            eventtype = [eventtype]
+        matched = [event for event in self._queue if event.type in eventtype]
+        self._queue = [event for event in self._queue if event.type not in eventtype]
+        return matched
+
+    def wait(self, timeout=None):
+        if self._queue:
+            return self._queue.pop(0)
+        return Event(NOEVENT)
+
+    def clear(self):
+        self._queue = []
+
+    def set_blocked(self, types):
+        if types is None:
+            self._allowed = set()
+
+    def set_allowed(self, types):
+        if types is None:
+            self._allowed = None
+            return
+        if isinstance(types, int):
+            types = [types]
+        if self._allowed is None:
+            self._allowed = set()
+        self._allowed.update(types)
+
+
+event = _EventModule()
+
+
+class Clock:
+    def __init__(self):
+        self.ticks = 0
+
+    def tick(self, framerate=0):
+        self.ticks += 1
+        return 16
+
+    def get_fps(self):
+        return 60.0
+
+
+class _TimeModule:
+    Clock = Clock
+
+    def __init__(self):
+        self._ticks = 0
+
+    def get_ticks(self):
+        self._ticks += 16
+        return self._ticks
+
+    def wait(self, milliseconds):
+        return milliseconds
+
+    def delay(self, milliseconds):
+        return milliseconds
+
+
+time = _TimeModule()
+
+
+class _ImageModule:
+    def tobytes(self, surface, format):  # noqa: A002 - mirrors pygame
+        if format == "RGBA":
+            return bytes(surface._pixels)
+        if format == "RGB":
+            pixels = surface._pixels
+            out = bytearray(surface._w * surface._h * 3)
+            for index in range(surface._w * surface._h):
+                out[index * 3 : index * 3 + 3] = pixels[index * 4 : index * 4 + 3]
+            return bytes(out)
+        raise ValueError(f"unsupported format {format!r}")
+
+    # pygame < 2.2 spelling
+    tostring = tobytes
+
+    def frombuffer(self, buffer, size, format):  # noqa: A002 - mirrors pygame
+        surface = Surface(size, SRCALPHA)
+        data = bytes(buffer)
+        if format == "RGBA":
+            surface._pixels[:] = data
+        elif format == "BGRA":
+            for index in range(0, len(data), 4):
+                surface._pixels[index] = data[index + 2]
+                surface._pixels[index + 1] = data[index + 1]
+                surface._pixels[index + 2] = data[index]
+                surface._pixels[index + 3] = data[index + 3]
+        else:
+            raise ValueError(f"unsupported format {format!r}")
+        return surface
+
+    def load(self, file):
+        raise NotImplementedError("the pygame stub cannot decode image files")
+
+
+image = _ImageModule()
+
+
+class _SurfarrayModule:
+    def pixels3d(self, surface):
+        import numpy
+
+        array = numpy.frombuffer(bytes(surface._pixels), dtype=numpy.uint8)
+        array = array.reshape((surface._h, surface._w, 4))[:, :, :3]
+        return array.transpose(1, 0, 2)
+
+
+surfarray = _SurfarrayModule()
+
+
+class version:
+    ver = "0.0-stub"
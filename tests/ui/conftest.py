@@ -0,0 +1,96 @@
+"""Shared fixtures for the UI test suite.
+
+The suite runs against a deterministic pure-Python pygame stub (see
+``_stubs/pygame``) so it needs neither SDL nor a display.  The stub directory
+is placed ahead of site-packages on ``sys.path`` so any ``import pygame``
+below this package resolves to the stub.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Only the cheap parts run at collection: the env defaults and the path
+# shuffle.  The actual stub module executes on first use — either a test
+# module's own 'import pygame' or the session fixture below — so collecting
+# (or deselecting) the UI suite never pays an exec_module.
+os.environ.setdefault("LASER_GAME_FORCE_PYGAME_STUB", "1")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+_STUB_PATH = Path(__file__).resolve().parent / "_stubs"
+
+if os.environ.get("LASER_GAME_FORCE_PYGAME_STUB") == "1" and str(_STUB_PATH) not in sys.path:
+    sys.path.insert(0, str(_STUB_PATH))
+
+
+def _import_pygame_stub():
+    cached = sys.modules.get("pygame")
+    if cached is not None:
+        return cached
+    import pygame
+
+    return pygame
+
+
+@pytest.fixture(scope="session")
+def pygame_module():
+    return _import_pygame_stub()
+
+
+@pytest.fixture(autouse=True)
+def _clear_event_queue(pygame_module):
+    yield
+    pygame_module.event.clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_ui_caches():
+    # The directory-resolution and geometry caches key on env values and
+    # board shapes; clearing between tests keeps monkeypatched env vars and
+    # tmp_path stat results from leaking across test lifetimes.  The asset
+    # master cache is deliberately left warm — its key includes mtime_ns, so
+    # stale hits are impossible, and clearing it would re-rasterise the
+    # session asset library's inputs on every direct load_svg_assets call.
+    yield
+    from laser_game.ui import layout
+    from laser_game.ui.main import _resolve_cached
+
+    _resolve_cached.cache_clear()
+    layout.compute_geometry.cache_clear()
+
+
+_LEVEL_ROOT = Path(__file__).resolve().parents[2] / "laser_game" / "levels"
+
+
+@pytest.fixture(scope="session")
+def asset_library(pygame_module):
+    # Rasterise the SVG assets once for the whole suite; every UI under
+    # test shares the library instead of re-running the asset pipeline.
+    from laser_game.ui.assets import load_svg_assets
+
+    return load_svg_assets(size=24)
+
+
+@pytest.fixture
+def ui_factory(pygame_module, asset_library):
+    """Build a LaserGameUI against the shared session asset library."""
+    from laser_game.game import LaserGame, LevelLoader
+    from laser_game.ui import LaserGameUI
+
+    def _make(level_name="intro", cell_size=24, surface_size=(500, 400)):
+        loader = LevelLoader(_LEVEL_ROOT)
+        game = LaserGame(loader.load(level_name))
+        surface = pygame_module.Surface(surface_size)
+        ui = LaserGameUI(
+            game,
+            cell_size=cell_size,
+            surface=surface,
+            level_loader=loader,
+            assets=asset_library,
+        )
+        ui.update_playthrough()
+        return ui
+
+    return _make
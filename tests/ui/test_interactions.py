@@ -0,0 +1,71 @@
+import pytest
+
+# pygame resolves through the session fixture so collection never imports
+# it; every test here drives the UI with synthetic events anyway.
+
+
+@pytest.fixture
+def ui(ui_factory):
+    return ui_factory("intro")
+
+
+def test_click_places_mirror(ui, pygame_module):
+    pygame = pygame_module
+    cell = (3, 3)
+    pixel = ui.geometry.cell_to_center(cell)
+    ui.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pixel, button=1))
+    assert ui._needs_update
+    ui.update_playthrough()
+    assert cell in ui.level.mirrors
+    assert ui.level.mirrors[cell].orientation == "/"
+
+
+def test_click_toggles_mirror_orientation(ui, pygame_module):
+    pygame = pygame_module
+    cell = (3, 3)
+    pixel = ui.geometry.cell_to_center(cell)
+    for _ in range(2):
+        ui.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pixel, button=1))
+        ui.update_playthrough()
+    assert ui.level.mirrors[cell].orientation == "\\"
+
+
+def test_right_click_removes_mirror(ui, pygame_module):
+    pygame = pygame_module
+    cell = (3, 3)
+    pixel = ui.geometry.cell_to_center(cell)
+    ui.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pixel, button=1))
+    ui.update_playthrough()
+    ui.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pixel, button=3))
+    ui.update_playthrough()
+    assert cell not in ui.level.mirrors
+
+
+def test_click_outside_grid_is_ignored(ui, pygame_module):
+    pygame = pygame_module
+    ui.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(1, 1), button=1))
+    assert not ui._needs_update
+    assert not ui.level.mirrors
+
+
+def test_keyboard_cycles_levels(ui, pygame_module):
+    pygame = pygame_module
+    first = ui.level.name
+    ui.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_n))
+    assert ui.level.name != first
+    ui.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p))
+    assert ui.level.name == first
+
+
+def test_inert_event_does_not_mark_frame_dirty(ui, pygame_module):
+    pygame = pygame_module
+    ui._dirty = False
+    ui.handle_event(pygame.event.Event(pygame.MOUSEMOTION, pos=(1, 1)))
+    assert not ui._dirty
+
+
+def test_quit_event_stops_loop(ui, pygame_module):
+    pygame = pygame_module
+    ui.running = True
+    ui.handle_event(pygame.event.Event(pygame.QUIT))
+    assert not ui.running
@@ -0,0 +1,35 @@
+from laser_game.ui.layout import (
+    DEFAULT_CELL_SIZE,
+    GRID_MARGIN,
+    HUD_HEIGHT,
+    MIN_SCREEN_WIDTH,
+    compute_geometry,
+    screen_size_for,
+)
+
+
+def test_compute_geometry_defaults():
+    geometry = compute_geometry(9, 7)
+    assert geometry.origin == (GRID_MARGIN, GRID_MARGIN)
+    assert geometry.cell_size == DEFAULT_CELL_SIZE
+    assert geometry.pixel_size == (9 * DEFAULT_CELL_SIZE, 7 * DEFAULT_CELL_SIZE)
+
+
+def test_cell_to_center_is_cell_midpoint():
+    geometry = compute_geometry(5, 5, cell_size=20)
+    assert geometry.cell_to_topleft((0, 0)) == (GRID_MARGIN, GRID_MARGIN)
+    assert geometry.cell_to_center((0, 0)) == (GRID_MARGIN + 10, GRID_MARGIN + 10)
+    assert geometry.cell_to_center((2, 1)) == (GRID_MARGIN + 50, GRID_MARGIN + 30)
+
+
+def test_screen_size_covers_grid_and_hud():
+    geometry = compute_geometry(9, 7, cell_size=24)
+    width, height = screen_size_for(geometry)
+    assert width >= 9 * 24 + 2 * GRID_MARGIN
+    assert height >= 7 * 24 + 2 * GRID_MARGIN + HUD_HEIGHT
+
+
+def test_screen_size_has_floor_for_tiny_levels():
+    geometry = compute_geometry(2, 2, cell_size=8)
+    width, _ = screen_size_for(geometry)
+    assert width == MIN_SCREEN_WIDTH
@@ -0,0 +1,48 @@
+import pytest
+
+from laser_game.ui.main import (
+    ASSET_ENV_VAR,
+    LEVEL_ENV_VAR,
+    bootstrap_directories,
+    resolve_directories,
+)
+
+
+def test_resolve_directories_defaults(monkeypatch):
+    monkeypatch.delenv(ASSET_ENV_VAR, raising=False)
+    monkeypatch.delenv(LEVEL_ENV_VAR, raising=False)
+    directories = resolve_directories()
+    assert directories.assets.is_dir()
+    assert directories.levels.is_dir()
+    assert directories.assets.name == "assets"
+    assert directories.levels.name == "levels"
+
+
+def test_resolve_directories_env_override(monkeypatch, tmp_path):
+    assets = tmp_path / "my-assets"
+    levels = tmp_path / "my-levels"
+    assets.mkdir()
+    levels.mkdir()
+    monkeypatch.setenv(ASSET_ENV_VAR, str(assets))
+    monkeypatch.setenv(LEVEL_ENV_VAR, str(levels))
+    directories = resolve_directories()
+    assert directories.assets == assets.resolve()
+    assert directories.levels == levels.resolve()
+
+
+def test_resolve_directories_missing_raises(monkeypatch, tmp_path):
+    monkeypatch.setenv(ASSET_ENV_VAR, str(tmp_path / "nope"))
+    monkeypatch.delenv(LEVEL_ENV_VAR, raising=False)
+    with pytest.raises(FileNotFoundError):
+        resolve_directories()
+    assert resolve_directories(check_exists=False).assets.name == "nope"
+
+
+def test_bootstrap_creates_missing_directories(monkeypatch, tmp_path):
+    assets = tmp_path / "assets"
+    levels = tmp_path / "levels"
+    monkeypatch.setenv(ASSET_ENV_VAR, str(assets))
+    monkeypatch.setenv(LEVEL_ENV_VAR, str(levels))
+    directories = bootstrap_directories()
+    assert directories.assets.is_dir()
+    assert directories.levels.is_dir()